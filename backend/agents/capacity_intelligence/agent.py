@@ -1,18 +1,39 @@
 
 
+import asyncio
+import json
+import logging
+import pickle
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, ClassVar, List, Optional, Tuple
 
 from .models import CapacityAssessment, UnitType, UnitCapacity
 from .trackers import CapacityTrackingSystem
 
+logger = logging.getLogger(__name__)
+
+
+# Precomputed name -> enum lookup, avoids EnumMeta.__call__ on hot paths
+_UNIT_BY_NAME: Dict[str, UnitType] = {u.value: u for u in UnitType}
+
+# Enum members materialized once so loops skip EnumMeta.__iter__
+_UNIT_TYPES: Tuple[UnitType, ...] = tuple(UnitType)
+
 
 class BaseAgent(ABC):
     
+    # Decision events are published in batches off the observe-decide path
+    PUBLISH_BATCH_SIZE = 32
+    PUBLISH_BATCH_INTERVAL = 0.05  # seconds
+    
     def __init__(self, event_bus=None, state_manager=None):
         self.event_bus = event_bus
         self.state = state_manager
+        self._publish_queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._event_topic = f"{type(self).__name__}.decision"
     
     @abstractmethod
     async def observe(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -26,16 +47,60 @@ class BaseAgent(ABC):
     
     async def execute(self, context: Dict[str, Any]) -> Any:
         """Execute the observe-decide cycle."""
-        observations = await self.observe(context)
-        decision = await self.decide(observations)
-        
-        if self.event_bus:
-            await self.event_bus.publish(
-                f"{self.__class__.__name__}.decision", 
-                decision
-            )
+        if self.event_bus is None:
+            return await self.decide(await self.observe(context))
         
+        decision = await self.decide(await self.observe(context))
+        self._enqueue_publish(self._event_topic, decision)
         return decision
+    
+    def _enqueue_publish(self, topic: str, payload: Any) -> None:
+        """Queue an event and make sure a flusher is running on this loop."""
+        loop = asyncio.get_running_loop()
+        task = self._flusher_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            queue = self._publish_queue
+            if queue is None or (task is not None and task.get_loop() is not loop):
+                # Queues belong to one event loop; carry over anything still pending
+                fresh = asyncio.Queue()
+                while queue is not None and not queue.empty():
+                    fresh.put_nowait(queue.get_nowait())
+                self._publish_queue = fresh
+            self._flusher_task = asyncio.create_task(self._flush_publishes())
+        self._publish_queue.put_nowait((topic, payload))
+    
+    async def _flush_publishes(self) -> None:
+        """Drain the publish queue in batches until it is empty."""
+        queue = self._publish_queue
+        while not queue.empty():
+            await asyncio.sleep(self.PUBLISH_BATCH_INTERVAL)
+            
+            batch = []
+            while len(batch) < self.PUBLISH_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            # A failed batch is logged and dropped; the flusher keeps draining
+            publish_batch = getattr(self.event_bus, "publish_batch", None)
+            try:
+                if publish_batch is not None:
+                    await publish_batch(batch)
+                    continue
+                results = await asyncio.gather(
+                    *(self.event_bus.publish(topic, payload) for topic, payload in batch),
+                    return_exceptions=True
+                )
+            except Exception as e:
+                logger.warning(f"Failed to publish {len(batch)} decision events: {e}")
+                continue
+            
+            for (topic, _), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to publish {topic} event: {result}")
+    
+    async def flush_publishes(self) -> None:
+        """Wait until all queued decision events have been published."""
+        if self._flusher_task is not None and not self._flusher_task.done():
+            await self._flusher_task
 
 class CapacityIntelligenceAgent(BaseAgent):
     """
@@ -56,19 +121,89 @@ class CapacityIntelligenceAgent(BaseAgent):
         
         # Sync usage (direct method calls)
         assessment = agent.get_unit_assessment("ICU")
+        
+        # Share unit assessments across worker processes
+        agent = CapacityIntelligenceAgent(redis_client=redis.Redis())
     """
     
-    def __init__(self, event_bus=None, state_manager=None):
+    # How long (seconds) a set of assessments may be reused if nothing changed
+    ASSESSMENT_CACHE_TTL = 0.5
+    
+    # Pickled demo CapacityTrackingSystem shared by all instances
+    _DEMO_SNAPSHOT: ClassVar[Optional[bytes]] = None
+    
+    # How long (seconds) a unit assessment lives in the shared Redis cache
+    SHARED_CACHE_TTL = 1
+    
+    def __init__(self, event_bus=None, state_manager=None, redis_client=None):
         super().__init__(event_bus, state_manager)
         self.tracking_system = CapacityTrackingSystem()
         self._initialized = False
+        
+        # Optional Redis client (anything with get/setex/delete) shared by workers
+        self.redis_client = redis_client
+        # Tracker revision and per-unit (bed, staff) revisions last reconciled
+        # with the shared cache, see _shared_cache_changed_units
+        self._shared_cache_revision = 0
+        self._shared_unit_revisions: Dict[UnitType, Tuple[int, int]] = {}
+        self._mark_shared_cache_synced()
+        
+        # (tracker revision, monotonic timestamp, assessments)
+        self._assessments_cache: Optional[Tuple[int, float, Dict[str, CapacityAssessment]]] = None
+        # (assessments the summary was built from, summary without timestamp)
+        self._summary_cache: Optional[Tuple[Dict[str, CapacityAssessment], Dict[str, Any]]] = None
     
     def initialize_demo_data(self) -> None:
-        """Initialize with demo hospital data for testing."""
-        self.tracking_system.initialize_demo_data()
+        """
+        Initialize with demo hospital data for testing.
+        
+        The demo tracking system is built once per process and restored from
+        a pickled snapshot for each new agent, so every agent still gets its
+        own mutable copy.
+        """
+        if self.tracking_system.revision == 0:
+            cls = type(self)
+            if cls._DEMO_SNAPSHOT is None:
+                demo_system = CapacityTrackingSystem()
+                demo_system.initialize_demo_data()
+                cls._DEMO_SNAPSHOT = pickle.dumps(demo_system, pickle.HIGHEST_PROTOCOL)
+            self.tracking_system = pickle.loads(cls._DEMO_SNAPSHOT)
+        else:
+            # Trackers already hold data, add the demo beds/staff on top
+            self.tracking_system.initialize_demo_data()
+        
+        self._assessments_cache = None
+        self._summary_cache = None
+        # Loading the trackers is not a local change; other workers' snapshots stay valid
+        self._mark_shared_cache_synced()
         self._initialized = True
     
+    async def execute(self, context: Dict[str, Any]) -> Dict[str, CapacityAssessment]:
+        """Execute the observe-decide cycle without awaiting the async wrappers."""
+        if self.event_bus is None:
+            return self.execute_sync(context)
+        
+        decision = self.execute_sync(context)
+        self._enqueue_publish(self._event_topic, decision)
+        return decision
+    
+    def execute_sync(self, context: Dict[str, Any]) -> Dict[str, CapacityAssessment]:
+        """Run the observe-decide cycle synchronously, without event publishing."""
+        observations, capacities = self._observe_sync(context)
+        return self._decide_sync(observations, capacities)
+    
     async def observe(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Gather current capacity data (see _observe_sync)."""
+        return self._observe_sync(context)[0]
+    
+    async def decide(self, observations: Dict[str, Any]) -> Dict[str, CapacityAssessment]:
+        """Produce CapacityAssessment outputs (see _decide_sync)."""
+        return self._decide_sync(observations)
+    
+    def _observe_sync(
+        self,
+        context: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[UnitType, UnitCapacity]]:
         """
         Gather current capacity data.
         
@@ -77,7 +212,10 @@ class CapacityIntelligenceAgent(BaseAgent):
                     or observe all units if not specified.
         
         Returns:
-            dict with capacity observations for requested unit(s)
+            Tuple of (dict with capacity observations for requested unit(s),
+            the observed UnitCapacity per unit with staff_on_duty filled in).
+            The capacities let execute_sync skip re-reading the trackers;
+            they are not part of the public observation.
         """
         if not self._initialized:
             self.initialize_demo_data()
@@ -86,57 +224,83 @@ class CapacityIntelligenceAgent(BaseAgent):
         
         if unit_name:
             # Observe specific unit
-            try:
-                unit = UnitType(unit_name) if isinstance(unit_name, str) else unit_name
-                capacity = self.tracking_system.bed_tracker.get_unit_capacity(unit)
-                staff_metrics = self.tracking_system.staff_tracker.get_unit_staff_metrics(unit)
-                
-                return {
-                    "unit": unit_name,
-                    "bed_capacity": capacity.to_dict(),
-                    "staff_metrics": staff_metrics,
-                    "timestamp": datetime.now().isoformat()
-                }
-            except ValueError:
-                return {"error": f"Unknown unit: {unit_name}"}
+            unit = unit_name if isinstance(unit_name, UnitType) else _UNIT_BY_NAME.get(unit_name)
+            if unit is None:
+                return {"error": f"Unknown unit: {unit_name}"}, {}
+            
+            capacity = self.tracking_system.bed_tracker.get_unit_capacity(unit)
+            staff_metrics = self.tracking_system.staff_tracker.get_unit_staff_metrics(unit)
+            observation = {
+                "unit": unit_name,
+                "bed_capacity": capacity.to_dict(),
+                "staff_metrics": staff_metrics,
+                "timestamp": datetime.now().isoformat()
+            }
+            capacity.staff_on_duty = staff_metrics["staff_count"]
+            return observation, {unit: capacity}
         else:
             # Observe all units
             observations = {}
-            for unit in UnitType:
+            capacities = {}
+            for unit in _UNIT_TYPES:
                 capacity = self.tracking_system.bed_tracker.get_unit_capacity(unit)
                 staff_metrics = self.tracking_system.staff_tracker.get_unit_staff_metrics(unit)
                 observations[unit.value] = {
                     "bed_capacity": capacity.to_dict(),
                     "staff_metrics": staff_metrics
                 }
+                capacity.staff_on_duty = staff_metrics["staff_count"]
+                capacities[unit] = capacity
             
             observations["timestamp"] = datetime.now().isoformat()
-            return observations
+            return observations, capacities
     
-    async def decide(self, observations: Dict[str, Any]) -> Dict[str, CapacityAssessment]:
+    def _decide_sync(
+        self,
+        observations: Dict[str, Any],
+        capacities: Optional[Dict[UnitType, UnitCapacity]] = None
+    ) -> Dict[str, CapacityAssessment]:
         """
         Produce CapacityAssessment outputs based on observations.
         
+        Args:
+            observations: Output of observe()
+            capacities: UnitCapacity per unit from _observe_sync, if available;
+                units without one are assessed from the trackers
+        
         Returns:
             dict mapping unit names to CapacityAssessment objects
         """
         assessments = {}
+        capacities = capacities or {}
         
         # Check if single unit observation
         if "unit" in observations and "bed_capacity" in observations:
             unit_name = observations["unit"]
-            unit = UnitType(unit_name) if isinstance(unit_name, str) else unit_name
-            assessment = self.tracking_system.get_unit_assessment(unit)
-            assessments[unit_name] = assessment
+            unit = unit_name if isinstance(unit_name, UnitType) else _UNIT_BY_NAME[unit_name]
+            assessments[unit_name] = self._assessment_from_capacity(unit, capacities.get(unit))
         else:
             # Multiple units
-            for unit in UnitType:
+            for unit in _UNIT_TYPES:
                 if unit.value in observations:
-                    assessment = self.tracking_system.get_unit_assessment(unit)
-                    assessments[unit.value] = assessment
+                    assessments[unit.value] = self._assessment_from_capacity(
+                        unit, capacities.get(unit)
+                    )
         
         return assessments
     
+    def _assessment_from_capacity(
+        self,
+        unit: UnitType,
+        unit_cap: Optional[UnitCapacity]
+    ) -> CapacityAssessment:
+        """Build an assessment from a UnitCapacity already gathered by _observe_sync."""
+        if unit_cap is None:
+            return self.tracking_system.get_unit_assessment(unit)
+        
+        predicted = self.tracking_system.predictor.predict_next_available(unit)
+        return CapacityAssessment.from_unit_capacity(unit_cap, predicted)
+    
     # ========================================================================
     # Synchronous convenience methods for direct usage
     # ========================================================================
@@ -154,20 +318,84 @@ class CapacityIntelligenceAgent(BaseAgent):
         if not self._initialized:
             self.initialize_demo_data()
         
-        unit_type = UnitType(unit)
+        unit_type = unit if isinstance(unit, UnitType) else _UNIT_BY_NAME.get(unit)
+        if unit_type is None:
+            raise ValueError(f"Unknown unit: {unit}")
+        
+        if self.redis_client is not None:
+            try:
+                return self._get_shared_assessment(unit_type)
+            except Exception as e:
+                logger.warning(f"Shared capacity cache unavailable: {e}")
+        
         return self.tracking_system.get_unit_assessment(unit_type)
     
+    def _get_shared_assessment(self, unit: UnitType) -> CapacityAssessment:
+        """Read-through Redis cache so worker processes share unit snapshots."""
+        key = f"capacity:{unit.value}"
+        changed = self._shared_cache_changed_units()
+        if changed:
+            # Units this process modified since the last read; their snapshots are stale
+            self.redis_client.delete(*(f"capacity:{u.value}" for u in changed))
+        
+        if unit not in changed:
+            cached = self.redis_client.get(key)
+            if cached is not None:
+                return CapacityAssessment.from_dict(json.loads(cached))
+        
+        assessment = self.tracking_system.get_unit_assessment(unit)
+        self.redis_client.setex(key, self.SHARED_CACHE_TTL, assessment.to_json_bytes())
+        return assessment
+    
+    def _unit_revisions(self, unit: UnitType) -> Tuple[int, int]:
+        """(bed, staff) mutation counters of one unit in the local trackers."""
+        return (
+            self.tracking_system.bed_tracker.unit_revisions.get(unit, 0),
+            self.tracking_system.staff_tracker.unit_revisions.get(unit, 0)
+        )
+    
+    def _mark_shared_cache_synced(self) -> None:
+        """Record the current tracker state as matching the shared cache."""
+        self._shared_cache_revision = self.tracking_system.revision
+        self._shared_unit_revisions = {unit: self._unit_revisions(unit) for unit in _UNIT_TYPES}
+    
+    def _shared_cache_changed_units(self) -> List[UnitType]:
+        """Units modified locally since the last call (or since the trackers were loaded)."""
+        revision = self.tracking_system.revision
+        if revision == self._shared_cache_revision:
+            return []
+        self._shared_cache_revision = revision
+        
+        changed = []
+        for unit in _UNIT_TYPES:
+            revisions = self._unit_revisions(unit)
+            if revisions != self._shared_unit_revisions[unit]:
+                self._shared_unit_revisions[unit] = revisions
+                changed.append(unit)
+        return changed
+    
     def get_all_assessments(self) -> Dict[str, CapacityAssessment]:
         """
         Get capacity assessments for all units (sync method).
         
+        Results are reused for up to ASSESSMENT_CACHE_TTL seconds as long as
+        the tracking system has not been modified in the meantime.
+        
         Returns:
             dict mapping unit names to CapacityAssessment objects
         """
         if not self._initialized:
             self.initialize_demo_data()
         
-        return self.tracking_system.get_all_assessments()
+        revision = self.tracking_system.revision
+        now = time.monotonic()
+        cached = self._assessments_cache
+        if cached is not None and cached[0] == revision and now - cached[1] < self.ASSESSMENT_CACHE_TTL:
+            return cached[2]
+        
+        assessments = self.tracking_system.get_all_assessments()
+        self._assessments_cache = (revision, now, assessments)
+        return assessments
     
     def get_unit_occupancy(self, unit: str) -> float:
         """Get current occupancy rate for a unit."""
@@ -182,11 +410,9 @@ class CapacityIntelligenceAgent(BaseAgent):
         if unit:
             assessment = self.get_unit_assessment(unit)
             return assessment.available_bed_count
-        else:
-            total = 0
-            for assessment in self.get_all_assessments().values():
-                total += assessment.available_bed_count
-            return total
+        
+        # Running counter, no need to build assessments for a hospital-wide total
+        return self.tracking_system.bed_tracker.total_available
     
     def find_best_unit_for_admission(self, 
                                       preferred_units: Optional[List[str]] = None
@@ -202,19 +428,17 @@ class CapacityIntelligenceAgent(BaseAgent):
         """
         assessments = self.get_all_assessments()
         
-        candidates = []
+        # Track the unit with highest capacity score (first one wins ties)
+        best_unit = None
+        best_score = float('-inf')
         for unit_name, assessment in assessments.items():
             if preferred_units and unit_name not in preferred_units:
                 continue
-            if assessment.available_bed_count > 0:
-                candidates.append((unit_name, assessment.capacity_score))
+            if assessment.available_bed_count > 0 and assessment.capacity_score > best_score:
+                best_unit = unit_name
+                best_score = assessment.capacity_score
         
-        if not candidates:
-            return None
-        
-        # Return unit with highest capacity score
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates[0][0]
+        return best_unit
     
     def get_status_summary(self) -> Dict[str, Any]:
         """
@@ -228,26 +452,32 @@ class CapacityIntelligenceAgent(BaseAgent):
         
         assessments = self.get_all_assessments()
         
-        total_beds = sum(a.total_bed_count for a in assessments.values())
-        available_beds = sum(a.available_bed_count for a in assessments.values())
-        
-        units_summary = {}
-        for unit_name, assessment in assessments.items():
-            units_summary[unit_name] = {
-                "occupancy": f"{assessment.current_occupancy:.1%}",
-                "available": assessment.available_bed_count,
-                "total": assessment.total_bed_count,
-                "capacity_score": f"{assessment.capacity_score:.1f}",
-                "bottleneck": assessment.bottleneck_reason
+        cached = self._summary_cache
+        if cached is not None and cached[0] is assessments:
+            summary = cached[1]
+        else:
+            total_beds = available_beds = 0
+            units_summary = {}
+            for unit_name, assessment in assessments.items():
+                total_beds += assessment.total_bed_count
+                available_beds += assessment.available_bed_count
+                units_summary[unit_name] = {
+                    "occupancy": f"{assessment.current_occupancy:.1%}",
+                    "available": assessment.available_bed_count,
+                    "total": assessment.total_bed_count,
+                    "capacity_score": f"{assessment.capacity_score:.1f}",
+                    "bottleneck": assessment.bottleneck_reason
+                }
+            
+            summary = {
+                "hospital_total_beds": total_beds,
+                "hospital_available_beds": available_beds,
+                "hospital_occupancy": f"{(total_beds - available_beds) / total_beds:.1%}" if total_beds > 0 else "N/A",
+                "units": units_summary
             }
+            self._summary_cache = (assessments, summary)
         
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "hospital_total_beds": total_beds,
-            "hospital_available_beds": available_beds,
-            "hospital_occupancy": f"{(total_beds - available_beds) / total_beds:.1%}" if total_beds > 0 else "N/A",
-            "units": units_summary
-        }
+        return {"timestamp": datetime.now().isoformat(), **summary}
 
 
 # Convenience function for quick testing
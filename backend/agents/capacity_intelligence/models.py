@@ -6,18 +6,64 @@ and unit-level capacity assessments.
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Optional, List, Dict, Any
+from enum import Enum, IntEnum
+from typing import Optional, List, Dict, Any, Mapping, Tuple
 from dataclasses import dataclass, field
 
+from backend.utils.serialization import ReadOnlyDict, dumps_bytes, orjson
 
-class BedState(str, Enum):
-    """Possible states for a hospital bed."""
-    AVAILABLE = "available"
-    OCCUPIED = "occupied"
-    RESERVED = "reserved"
-    CLEANING = "cleaning"
-    MAINTENANCE = "maintenance"
+
+# Staff adequacy is capped at 1.5 and mapped onto 0-50 points
+_STAFF_SCORE_SCALE = 50 / 1.5
+
+# Bottleneck reason indexed by (occupancy > 0.9) + 2 * (staff_adequacy < 0.7)
+_BOTTLENECKS = (None, "High bed occupancy", "Staff shortage", "High bed occupancy")
+
+
+def capacity_metrics(
+    occupied: int,
+    total: int,
+    staff_on_duty: int,
+    target_staff_ratio: float
+) -> Tuple[float, float, float, float]:
+    """
+    Capacity scoring kernel over raw unit counts.
+    
+    Works on plain numbers only so it can be called in tight loops
+    without attribute lookups.
+    
+    Returns:
+        Tuple of (occupancy_rate, current_staff_ratio, staff_adequacy, capacity_score)
+    """
+    occupancy = occupied / total if total else 0.0
+    staff_ratio = occupied / staff_on_duty if staff_on_duty else float('inf')
+    
+    if target_staff_ratio == 0:
+        adequacy = 1.0
+    else:
+        adequacy = target_staff_ratio / staff_ratio if staff_ratio > 0 else 1.0
+    
+    # Capacity score (0-100), higher = more capacity available:
+    # up to 50 points for bed availability, up to 50 for staffing
+    capacity_score = (
+        (1 - occupancy) * 50
+        + (adequacy if adequacy < 1.5 else 1.5) * _STAFF_SCORE_SCALE
+    )
+    
+    return occupancy, staff_ratio, adequacy, capacity_score
+
+
+class BedState(IntEnum):
+    """Possible states for a hospital bed (small ints, strings only at serialization)."""
+    AVAILABLE = 0
+    OCCUPIED = 1
+    RESERVED = 2
+    CLEANING = 3
+    MAINTENANCE = 4
+
+
+# Serialized names for BedState, indexed by the enum's int value
+_BED_STATE_STR = ("available", "occupied", "reserved", "cleaning", "maintenance")
 
 
 class UnitType(str, Enum):
@@ -29,7 +75,7 @@ class UnitType(str, Enum):
     PACU = "PACU"  # Post-Anesthesia Care Unit
 
 
-@dataclass
+@dataclass(slots=True)
 class BedStatus:
     """Status of an individual hospital bed."""
     bed_id: str
@@ -40,23 +86,35 @@ class BedStatus:
     last_state_change: datetime = field(default_factory=datetime.now)
     estimated_available_at: Optional[datetime] = None
     
+    # (datetime, iso string) for last_state_change; stale once the field is reassigned
+    _iso_cache: Optional[Tuple[datetime, str]] = field(default=None, init=False, repr=False, compare=False)
+    
     @property
     def is_available(self) -> bool:
         return self.state == BedState.AVAILABLE
     
+    @property
+    def last_state_change_iso(self) -> str:
+        """ISO-formatted last_state_change, formatted once per state change."""
+        cached = self._iso_cache
+        if cached is None or cached[0] is not self.last_state_change:
+            cached = (self.last_state_change, self.last_state_change.isoformat())
+            self._iso_cache = cached
+        return cached[1]
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "bed_id": self.bed_id,
             "unit": self.unit.value,
-            "state": self.state.value,
+            "state": _BED_STATE_STR[self.state],
             "patient_id": self.patient_id,
             "assigned_nurse_id": self.assigned_nurse_id,
-            "last_state_change": self.last_state_change.isoformat(),
+            "last_state_change": self.last_state_change_iso,
             "estimated_available_at": self.estimated_available_at.isoformat() if self.estimated_available_at else None
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class StaffWorkload:
     """Workload metrics for a staff member."""
     staff_id: str
@@ -74,7 +132,8 @@ class StaffWorkload:
         """Calculate workload as a percentage (0-1)."""
         if self.max_patient_capacity == 0:
             return 1.0
-        return min(self.current_patient_count / self.max_patient_capacity, 1.0)
+        ratio = self.current_patient_count / self.max_patient_capacity
+        return ratio if ratio < 1.0 else 1.0
     
     @property
     def available_capacity(self) -> int:
@@ -95,7 +154,7 @@ class StaffWorkload:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UnitCapacity:
     """Aggregate capacity metrics for a hospital unit."""
     unit: UnitType
@@ -107,6 +166,11 @@ class UnitCapacity:
     staff_on_duty: int = 0
     target_staff_ratio: float = 0.25  # Target patients per staff member
     
+    @classmethod
+    def empty(cls, unit: UnitType) -> "UnitCapacity":
+        """Capacity of a unit with no beds and no staff."""
+        return cls(unit=unit, total_beds=0, occupied_beds=0, available_beds=0)
+    
     @property
     def occupancy_rate(self) -> float:
         """Bed occupancy as a percentage (0-1)."""
@@ -133,6 +197,20 @@ class UnitCapacity:
             return 1.0
         return self.target_staff_ratio / self.current_staff_ratio if self.current_staff_ratio > 0 else 1.0
     
+    @property
+    def metrics(self) -> Tuple[float, float, float, float]:
+        """
+        Derived metrics computed together from the raw counts.
+        
+        Not cached because staff_on_duty is filled in after construction.
+        
+        Returns:
+            Tuple of (occupancy_rate, current_staff_ratio, staff_adequacy, capacity_score)
+        """
+        return capacity_metrics(
+            self.occupied_beds, self.total_beds, self.staff_on_duty, self.target_staff_ratio
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "unit": self.unit.value,
@@ -149,7 +227,7 @@ class UnitCapacity:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CapacityAssessment:
     """
     Output from the Capacity Intelligence Agent.
@@ -171,8 +249,18 @@ class CapacityAssessment:
     staff_on_duty: int = 0
     bottleneck_reason: Optional[str] = None
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    # Serialized form, built on the first to_dict() call. This relies on the
+    # model not being modified after it is built; the cached dict is read-only
+    # so callers cannot alter it either. Other cached to_dict() implementations
+    # (flow orchestrator models, MCDAScores) follow the same rule.
+    _dict_cache: Optional[ReadOnlyDict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> Mapping[str, Any]:
+        """Serialize to a read-only dict (built once, then reused)."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        
+        self._dict_cache = ReadOnlyDict({
             "unit": self.unit,
             "current_occupancy": self.current_occupancy,
             "staff_ratio": self.staff_ratio,
@@ -184,28 +272,47 @@ class CapacityAssessment:
             "total_bed_count": self.total_bed_count,
             "staff_on_duty": self.staff_on_duty,
             "bottleneck_reason": self.bottleneck_reason
-        }
+        })
+        return self._dict_cache
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes, using orjson's native dataclass support when installed."""
+        if orjson is not None:
+            return orjson.dumps(self)
+        return dumps_bytes(self.to_dict())
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CapacityAssessment":
+        """Rebuild an assessment from the output of to_dict() or to_json_bytes()."""
+        predicted = data.get("predicted_availability")
+        staff_ratio = data["staff_ratio"]
+        return cls(
+            unit=data["unit"],
+            current_occupancy=data["current_occupancy"],
+            # orjson writes inf (no staff on duty) as null
+            staff_ratio=float('inf') if staff_ratio is None else staff_ratio,
+            capacity_score=data["capacity_score"],
+            predicted_availability=datetime.fromisoformat(predicted) if predicted else None,
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            confidence=data.get("confidence", 0.85),
+            available_bed_count=data.get("available_bed_count", 0),
+            total_bed_count=data.get("total_bed_count", 0),
+            staff_on_duty=data.get("staff_on_duty", 0),
+            bottleneck_reason=data.get("bottleneck_reason")
+        )
     
     @classmethod
     def from_unit_capacity(cls, unit_cap: UnitCapacity, predicted_availability: Optional[datetime] = None) -> "CapacityAssessment":
         """Create a CapacityAssessment from UnitCapacity data."""
-        # Calculate capacity score (0-100)
-        # Higher score = more capacity available
-        bed_score = (1 - unit_cap.occupancy_rate) * 50  # Up to 50 points for bed availability
-        staff_score = min(unit_cap.staff_adequacy, 1.5) / 1.5 * 50  # Up to 50 points for staffing
-        capacity_score = bed_score + staff_score
+        occupancy, staff_ratio, adequacy, capacity_score = unit_cap.metrics
         
-        # Determine bottleneck
-        bottleneck = None
-        if unit_cap.occupancy_rate > 0.9:
-            bottleneck = "High bed occupancy"
-        elif unit_cap.staff_adequacy < 0.7:
-            bottleneck = "Staff shortage"
+        # Determine bottleneck (bed occupancy wins when both apply)
+        bottleneck = _BOTTLENECKS[(occupancy > 0.9) + 2 * (adequacy < 0.7)]
         
         return cls(
             unit=unit_cap.unit.value,
-            current_occupancy=unit_cap.occupancy_rate,
-            staff_ratio=unit_cap.current_staff_ratio,
+            current_occupancy=occupancy,
+            staff_ratio=staff_ratio,
             capacity_score=capacity_score,
             predicted_availability=predicted_availability,
             available_bed_count=unit_cap.available_beds,
@@ -4,9 +4,13 @@ Capacity Intelligence Agent - Tracking Logic
 Real-time tracking for hospital beds and staff, with availability prediction.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import heapq
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
+from dataclasses import dataclass, field
 
 from .models import (
     BedStatus, BedState, StaffWorkload, UnitCapacity, 
@@ -14,23 +18,125 @@ from .models import (
 )
 
 
+def _epoch(value: Optional[datetime]) -> Optional[float]:
+    """Convert an optional datetime to epoch seconds."""
+    return value.timestamp() if value is not None else None
+
+
+@dataclass(slots=True)
+class _UnitColumns:
+    """
+    Per-unit bed data stored column-wise (struct-of-arrays).
+    
+    Row i of every column describes the same bed, so scans over one
+    attribute touch a single flat list instead of every BedStatus object.
+    Timestamps are stored as epoch seconds so scans compare plain floats.
+    """
+    bed_ids: List[str] = field(default_factory=list)
+    beds: List[BedStatus] = field(default_factory=list)
+    states: List[BedState] = field(default_factory=list)
+    last_state_change: List[float] = field(default_factory=list)
+    estimated_available_at: List[Optional[float]] = field(default_factory=list)
+    
+    def append(self, bed: BedStatus) -> int:
+        """Add a bed as a new row and return its row index."""
+        self.bed_ids.append(bed.bed_id)
+        self.beds.append(bed)
+        self.states.append(bed.state)
+        self.last_state_change.append(bed.last_state_change.timestamp())
+        self.estimated_available_at.append(_epoch(bed.estimated_available_at))
+        return len(self.bed_ids) - 1
+    
+    def write(self, row: int, bed: BedStatus) -> None:
+        """Overwrite a row with the bed's current values."""
+        self.beds[row] = bed
+        self.states[row] = bed.state
+        self.last_state_change[row] = bed.last_state_change.timestamp()
+        self.estimated_available_at[row] = _epoch(bed.estimated_available_at)
+    
+    def remove(self, row: int) -> None:
+        """Delete a row from every column."""
+        del self.bed_ids[row]
+        del self.beds[row]
+        del self.states[row]
+        del self.last_state_change[row]
+        del self.estimated_available_at[row]
+
+
 class BedTracker:
     """
     Tracks bed status changes and calculates occupancy metrics.
     
     Maintains an in-memory view of all beds across hospital units.
     In production, this would sync with a database/state manager.
+    
+    BedStatus objects are the public view; per-unit columns mirror the
+    fields that capacity and prediction scans read.
     """
     
     def __init__(self):
         self._beds: Dict[str, BedStatus] = {}
-        self._beds_by_unit: Dict[UnitType, List[str]] = defaultdict(list)
+        self._columns: Dict[UnitType, _UnitColumns] = defaultdict(_UnitColumns)
+        self._row: Dict[str, int] = {}  # bed_id -> row index in its unit's columns
+        # Index of AVAILABLE beds per unit (bed_id -> bed), maintained on every state change
+        self._available_by_unit: Dict[UnitType, Dict[str, BedStatus]] = defaultdict(dict)
+        self._total_available = 0
+        # Per-unit state counts, recomputed only for units written since the last read
+        self._unit_counts: Dict[UnitType, Tuple[int, int, int, int, int]] = {}
+        self._dirty_units: Set[UnitType] = set()
+        self.revision = 0  # Bumped on every mutation, used for cache invalidation
+        self.unit_revisions: Dict[UnitType, int] = defaultdict(int)  # Per-unit mutation counters
+    
+    @property
+    def total_available(self) -> int:
+        """Number of available beds across all units."""
+        return self._total_available
+    
+    def _index_availability(self, bed: BedStatus, old_state: Optional[BedState], new_state: Optional[BedState]) -> None:
+        """Update the available-bed index and total for a bed moving between states."""
+        was_available = old_state == BedState.AVAILABLE
+        is_available = new_state == BedState.AVAILABLE
+        if is_available and not was_available:
+            self._available_by_unit[bed.unit][bed.bed_id] = bed
+            self._total_available += 1
+        elif was_available and not is_available:
+            del self._available_by_unit[bed.unit][bed.bed_id]
+            self._total_available -= 1
+    
+    def _touch(self, unit: UnitType) -> None:
+        """Mark a unit as modified."""
+        self._dirty_units.add(unit)
+        self.unit_revisions[unit] += 1
     
     def register_bed(self, bed: BedStatus) -> None:
         """Register a new bed in the tracking system."""
+        # Interned ids let dict lookups hit the identity fast path
+        bed.bed_id = sys.intern(bed.bed_id)
+        if bed.patient_id:
+            bed.patient_id = sys.intern(bed.patient_id)
+        existing = self._beds.get(bed.bed_id)
         self._beds[bed.bed_id] = bed
-        if bed.bed_id not in self._beds_by_unit[bed.unit]:
-            self._beds_by_unit[bed.unit].append(bed.bed_id)
+        if existing is not None:
+            self._index_availability(existing, existing.state, None)
+        self._index_availability(bed, None, bed.state)
+        
+        self._touch(bed.unit)
+        if existing is not None and existing.unit == bed.unit:
+            self._columns[bed.unit].write(self._row[bed.bed_id], bed)
+        else:
+            if existing is not None:
+                self._touch(existing.unit)
+                self._remove_row(existing)
+            self._row[bed.bed_id] = self._columns[bed.unit].append(bed)
+        self.revision += 1
+    
+    def _remove_row(self, bed: BedStatus) -> None:
+        """Drop a bed from its unit's columns and reindex the rows after it."""
+        row = self._row.pop(bed.bed_id)
+        columns = self._columns[bed.unit]
+        columns.remove(row)
+        for idx in range(row, len(columns.bed_ids)):
+            self._row[columns.bed_ids[idx]] = idx
     
     def update_bed_state(
         self, 
@@ -44,32 +150,122 @@ class BedTracker:
             return None
         
         bed = self._beds[bed_id]
+        self._index_availability(bed, bed.state, new_state)
         bed.state = new_state
+        if patient_id:
+            patient_id = sys.intern(patient_id)
         bed.patient_id = patient_id if new_state == BedState.OCCUPIED else None
         bed.last_state_change = datetime.now()
         bed.estimated_available_at = estimated_available_at
+        self._columns[bed.unit].write(self._row[bed_id], bed)
+        self._touch(bed.unit)
+        self.revision += 1
         
         return bed
     
+    def bulk_register(
+        self,
+        unit: UnitType,
+        bed_ids: List[str],
+        states: List[BedState],
+        patient_ids: Optional[List[Optional[str]]] = None
+    ) -> List[BedStatus]:
+        """
+        Register many beds of one unit at once.
+        
+        New beds share one timestamp and are appended to the unit's columns
+        with a single extend per column. Ids that are already tracked go
+        through register_bed so re-registration semantics are unchanged.
+        """
+        if patient_ids is None:
+            patient_ids = [None] * len(bed_ids)
+        now = datetime.now()
+        
+        beds = [
+            BedStatus(
+                bed_id=sys.intern(bed_id),
+                unit=unit,
+                state=state,
+                patient_id=sys.intern(patient_id) if patient_id else patient_id,
+                last_state_change=now
+            )
+            for bed_id, state, patient_id in zip(bed_ids, states, patient_ids)
+        ]
+        if len(set(bed_ids)) != len(bed_ids):
+            # Duplicates within the batch: keep last-write-wins ordering
+            for bed in beds:
+                self.register_bed(bed)
+            return beds
+        
+        new_beds = []
+        for bed in beds:
+            if bed.bed_id in self._beds:
+                self.register_bed(bed)
+            else:
+                new_beds.append(bed)
+        if not new_beds:
+            return beds
+        
+        columns = self._columns[unit]
+        start = len(columns.bed_ids)
+        columns.bed_ids.extend(bed.bed_id for bed in new_beds)
+        columns.beds.extend(new_beds)
+        columns.states.extend(bed.state for bed in new_beds)
+        columns.last_state_change.extend([now.timestamp()] * len(new_beds))
+        columns.estimated_available_at.extend([None] * len(new_beds))
+        
+        available = self._available_by_unit[unit]
+        for row, bed in enumerate(new_beds, start):
+            self._beds[bed.bed_id] = bed
+            self._row[bed.bed_id] = row
+            if bed.state == BedState.AVAILABLE:
+                available[bed.bed_id] = bed
+                self._total_available += 1
+        self._touch(unit)
+        self.revision += 1
+        
+        return beds
+    
+    def tracked_units(self) -> List[UnitType]:
+        """Units that currently have at least one bed."""
+        return [unit for unit, columns in self._columns.items() if columns.bed_ids]
+    
+    def get_unit_columns(self, unit: UnitType) -> Optional[_UnitColumns]:
+        """Get the column view of a unit's beds (read-only), or None if untracked."""
+        return self._columns.get(unit)
+    
     def get_bed(self, bed_id: str) -> Optional[BedStatus]:
         """Get a specific bed's status."""
         return self._beds.get(bed_id)
     
     def get_unit_beds(self, unit: UnitType) -> List[BedStatus]:
         """Get all beds for a specific unit."""
-        bed_ids = self._beds_by_unit.get(unit, [])
-        return [self._beds[bid] for bid in bed_ids if bid in self._beds]
+        columns = self._columns.get(unit)
+        return list(columns.beds) if columns else []
     
     def get_unit_capacity(self, unit: UnitType) -> UnitCapacity:
-        """Calculate current capacity metrics for a unit."""
-        beds = self.get_unit_beds(unit)
+        """
+        Calculate current capacity metrics for a unit.
         
-        total = len(beds)
-        occupied = sum(1 for b in beds if b.state == BedState.OCCUPIED)
-        available = sum(1 for b in beds if b.state == BedState.AVAILABLE)
-        reserved = sum(1 for b in beds if b.state == BedState.RESERVED)
-        cleaning = sum(1 for b in beds if b.state == BedState.CLEANING)
+        Bed counts are cached per unit and invalidated by register_bed and
+        update_bed_state. A fresh UnitCapacity is returned on every call
+        since callers fill in staff_on_duty themselves.
+        """
+        counts = self._unit_counts.get(unit)
+        if counts is None or unit in self._dirty_units:
+            columns = self._columns.get(unit)
+            states = columns.states if columns else []
+            counts = (
+                len(states),
+                states.count(BedState.OCCUPIED),
+                states.count(BedState.AVAILABLE),
+                states.count(BedState.RESERVED),
+                states.count(BedState.CLEANING),
+            )
+            self._unit_counts[unit] = counts
+            self._dirty_units.discard(unit)
         
+        total, occupied, available, reserved, cleaning = counts
         return UnitCapacity(
             unit=unit,
             total_beds=total,
@@ -80,18 +276,25 @@ class BedTracker:
         )
     
     def get_available_beds(self, unit: Optional[UnitType] = None) -> List[BedStatus]:
-        """Get all available beds, optionally filtered by unit."""
+        """
+        Get all available beds, optionally filtered by unit.
+        
+        Served from the availability index, so cost is proportional to the
+        number of available beds rather than all beds.
+        """
         if unit:
-            beds = self.get_unit_beds(unit)
-        else:
-            beds = list(self._beds.values())
+            available = self._available_by_unit.get(unit)
+            return list(available.values()) if available else []
         
-        return [b for b in beds if b.is_available]
+        beds = []
+        for available in self._available_by_unit.values():
+            beds.extend(available.values())
+        return beds
     
     def get_all_units_capacity(self) -> Dict[UnitType, UnitCapacity]:
         """Get capacity metrics for all tracked units."""
         capacities = {}
-        for unit in self._beds_by_unit.keys():
+        for unit in self._columns.keys():
             capacities[unit] = self.get_unit_capacity(unit)
         return capacities
 
@@ -101,17 +304,118 @@ class StaffTracker:
     Tracks staff assignments and workload.
     
     Monitors staff-to-patient ratios and identifies capacity constraints.
+    
+    Patient counts of registered staff are changed through the tracker
+    (assign_patient, unassign_patient, update_workload) so the least-loaded
+    index stays current.
     """
     
     def __init__(self):
         self._staff: Dict[str, StaffWorkload] = {}
         self._staff_by_unit: Dict[UnitType, List[str]] = defaultdict(list)
+        # Per-unit min-heap of (workload_ratio, seq, staff_id) with lazy deletion.
+        # seq is the staff member's registration order in the unit, so ties
+        # resolve the same way as a min() over the unit list.
+        self._load_heaps: Dict[UnitType, List[Tuple[float, int, str]]] = defaultdict(list)
+        self._unit_seq: Dict[str, int] = {}
+        self._next_seq = 0
+        self.revision = 0  # Bumped on every mutation, used for cache invalidation
+        self.unit_revisions: Dict[UnitType, int] = defaultdict(int)  # Per-unit mutation counters
     
     def register_staff(self, staff: StaffWorkload) -> None:
         """Register a staff member in the tracking system."""
+        staff.staff_id = sys.intern(staff.staff_id)
+        # _staff already dedups by id, so only new ids (or unit moves) touch the unit lists
+        existing = self._staff.get(staff.staff_id)
         self._staff[staff.staff_id] = staff
-        if staff.staff_id not in self._staff_by_unit[staff.unit]:
+        if existing is None or existing.unit != staff.unit:
+            if existing is not None:
+                self._staff_by_unit[existing.unit].remove(staff.staff_id)
+                self.unit_revisions[existing.unit] += 1
             self._staff_by_unit[staff.unit].append(staff.staff_id)
+            self._unit_seq[staff.staff_id] = self._next_seq
+            self._next_seq += 1
+        self._push_load(staff)
+        self.unit_revisions[staff.unit] += 1
+        self.revision += 1
+    
+    def bulk_register(self, staff_batch: List[StaffWorkload]) -> None:
+        """
+        Register many staff members at once.
+        
+        New ids are added with one dict update and one list extend and heap
+        rebuild per unit. Ids that are already tracked, or repeated within
+        the batch, fall back to register_staff.
+        """
+        for staff in staff_batch:
+            staff.staff_id = sys.intern(staff.staff_id)
+        ids = [staff.staff_id for staff in staff_batch]
+        if len(set(ids)) != len(ids):
+            for staff in staff_batch:
+                self.register_staff(staff)
+            return
+        
+        new_by_unit: Dict[UnitType, List[StaffWorkload]] = defaultdict(list)
+        for staff in staff_batch:
+            if staff.staff_id in self._staff:
+                self.register_staff(staff)
+            else:
+                new_by_unit[staff.unit].append(staff)
+        
+        for unit, new_staff in new_by_unit.items():
+            self._staff.update((staff.staff_id, staff) for staff in new_staff)
+            self._staff_by_unit[unit].extend(staff.staff_id for staff in new_staff)
+            heap = self._load_heaps[unit]
+            for staff in new_staff:
+                self._unit_seq[staff.staff_id] = self._next_seq
+                heap.append((staff.workload_ratio, self._next_seq, staff.staff_id))
+                self._next_seq += 1
+            heapq.heapify(heap)
+            self.unit_revisions[unit] += 1
+        if new_by_unit:
+            self.revision += 1
+    
+    def update_workload(
+        self,
+        staff_id: str,
+        current_patient_count: Optional[int] = None,
+        max_patient_capacity: Optional[int] = None
+    ) -> bool:
+        """Set a staff member's patient count and/or capacity and re-rank them."""
+        staff = self._staff.get(staff_id)
+        if staff is None:
+            return False
+        
+        if current_patient_count is not None:
+            staff.current_patient_count = current_patient_count
+        if max_patient_capacity is not None:
+            staff.max_patient_capacity = max_patient_capacity
+        self._workload_changed(staff)
+        return True
+    
+    def _workload_changed(self, staff: StaffWorkload) -> None:
+        """Re-rank a staff member after current_patient_count or max_patient_capacity changes."""
+        self._push_load(staff)
+        self.unit_revisions[staff.unit] += 1
+        self.revision += 1
+    
+    def _rebuild_load_heap(self, unit: UnitType) -> List[Tuple[float, int, str]]:
+        """Rebuild a unit's heap from the current workloads of its staff."""
+        heap = self._load_heaps[unit]
+        heap[:] = [
+            (self._staff[sid].workload_ratio, self._unit_seq[sid], sid)
+            for sid in self._staff_by_unit[unit]
+        ]
+        heapq.heapify(heap)
+        return heap
+    
+    def _push_load(self, staff: StaffWorkload) -> None:
+        """Record a staff member's current workload in their unit's heap."""
+        heap = self._load_heaps[staff.unit]
+        heapq.heappush(heap, (staff.workload_ratio, self._unit_seq[staff.staff_id], staff.staff_id))
+        # Superseded entries are dropped lazily; rebuild once they dominate
+        if len(heap) > 2 * len(self._staff_by_unit[staff.unit]) + 16:
+            self._rebuild_load_heap(staff.unit)
     
     def assign_patient(self, staff_id: str, patient_id: str) -> bool:
         """Assign a patient to a staff member."""
@@ -120,8 +424,9 @@ class StaffTracker:
         
         staff = self._staff[staff_id]
         if patient_id not in staff.assigned_patients:
-            staff.assigned_patients.append(patient_id)
+            staff.assigned_patients.append(sys.intern(patient_id))
             staff.current_patient_count = len(staff.assigned_patients)
+            self._workload_changed(staff)
         return True
     
     def unassign_patient(self, staff_id: str, patient_id: str) -> bool:
@@ -133,8 +438,13 @@ class StaffTracker:
         if patient_id in staff.assigned_patients:
             staff.assigned_patients.remove(patient_id)
             staff.current_patient_count = len(staff.assigned_patients)
+            self._workload_changed(staff)
         return True
     
+    def tracked_units(self) -> List[UnitType]:
+        """Units that currently have at least one staff member."""
+        return [unit for unit, staff_ids in self._staff_by_unit.items() if staff_ids]
+    
     def get_staff(self, staff_id: str) -> Optional[StaffWorkload]:
         """Get a staff member's workload."""
         return self._staff.get(staff_id)
@@ -157,10 +467,15 @@ class StaffTracker:
                 "average_workload": 0.0
             }
         
-        total_capacity = sum(s.max_patient_capacity for s in staff)
-        current_load = sum(s.current_patient_count for s in staff)
-        available_capacity = sum(s.available_capacity for s in staff)
-        avg_workload = sum(s.workload_ratio for s in staff) / len(staff)
+        # Single pass with running sums
+        total_capacity = current_load = available_capacity = 0
+        total_workload = 0.0
+        for s in staff:
+            total_capacity += s.max_patient_capacity
+            current_load += s.current_patient_count
+            available_capacity += s.available_capacity
+            total_workload += s.workload_ratio
+        avg_workload = total_workload / len(staff)
         
         return {
             "staff_count": len(staff),
@@ -170,17 +485,50 @@ class StaffTracker:
             "average_workload": avg_workload
         }
     
-    def find_available_staff(self, unit: UnitType, min_capacity: int = 1) -> List[StaffWorkload]:
-        """Find staff with available capacity in a unit."""
-        staff = self.get_unit_staff(unit)
-        return [s for s in staff if s.available_capacity >= min_capacity]
+    def find_available_staff(
+        self,
+        unit: UnitType,
+        min_capacity: int = 1,
+        limit: Optional[int] = None
+    ) -> List[StaffWorkload]:
+        """Find staff with available capacity in a unit, stopping after `limit` matches."""
+        found = []
+        if limit is not None and limit <= 0:
+            return found
+        for staff_id in self._staff_by_unit.get(unit, ()):
+            staff = self._staff[staff_id]
+            if staff.available_capacity >= min_capacity:
+                found.append(staff)
+                if len(found) == limit:
+                    break
+        return found
+    
+    def has_available_staff(self, unit: UnitType, min_capacity: int = 1) -> bool:
+        """Check whether any staff member in a unit has the given spare capacity."""
+        staff_by_id = self._staff
+        return any(
+            staff_by_id[staff_id].available_capacity >= min_capacity
+            for staff_id in self._staff_by_unit.get(unit, ())
+        )
     
     def get_least_loaded_staff(self, unit: UnitType) -> Optional[StaffWorkload]:
         """Find the staff member with the lowest workload in a unit."""
-        staff = self.get_unit_staff(unit)
-        if not staff:
-            return None
-        return min(staff, key=lambda s: s.workload_ratio)
+        heap = self._load_heaps.get(unit)
+        while heap:
+            ratio, seq, staff_id = heap[0]
+            staff = self._staff.get(staff_id)
+            if (
+                staff is not None
+                and staff.unit == unit
+                and staff.workload_ratio == ratio
+                and self._unit_seq[staff_id] == seq
+            ):
+                return staff
+            heapq.heappop(heap)  # Stale entry
+            if not heap and self._staff_by_unit.get(unit):
+                # Every entry was stale; fall back to the current workloads
+                heap = self._rebuild_load_heap(unit)
+        return None
 
 
 class AvailabilityPredictor:
@@ -202,6 +550,15 @@ class AvailabilityPredictor:
         UnitType.OR: 3,
         UnitType.PACU: 2
     }
+    DEFAULT_AVG_LOS = 48
+    
+    # Derived constants, built once instead of per call
+    # (in seconds, matching the epoch timestamps in the bed columns)
+    CLEANING_SECONDS = DEFAULT_CLEANING_TIME * 60
+    DISCHARGE_PREP_SECONDS = DEFAULT_DISCHARGE_PREP_TIME * 60
+    AVG_LOS_MINUTES = {unit: hours * 60 for unit, hours in AVG_LOS.items()}
+    # Offset to the next likely discharge: 10% of average LOS
+    NEAR_DISCHARGE_SECONDS = {unit: hours * 360 for unit, hours in AVG_LOS.items()}
     
     def __init__(self, bed_tracker: BedTracker):
         self.bed_tracker = bed_tracker
@@ -215,34 +572,34 @@ class AvailabilityPredictor:
         2. Beds with estimated availability times
         3. Historical discharge patterns
         """
-        beds = self.bed_tracker.get_unit_beds(unit)
-        now = datetime.now()
+        columns = self.bed_tracker.get_unit_columns(unit)
+        if not columns:
+            return None
+        states = columns.states
+        now = time.time()
         
         # Check for beds already in transition
-        cleaning_beds = [b for b in beds if b.state == BedState.CLEANING]
-        if cleaning_beds:
+        if BedState.CLEANING in states:
             # Estimate based on when cleaning started
+            changed = columns.last_state_change
             earliest = min(
-                b.last_state_change + timedelta(minutes=self.DEFAULT_CLEANING_TIME)
-                for b in cleaning_beds
-            )
-            return max(earliest, now)
+                changed[i] for i, state in enumerate(states) if state == BedState.CLEANING
+            ) + self.CLEANING_SECONDS
+            return datetime.fromtimestamp(max(earliest, now))
         
         # Check beds with estimated availability
-        with_estimates = [
-            b for b in beds 
-            if b.estimated_available_at and b.estimated_available_at > now
-        ]
-        if with_estimates:
-            return min(b.estimated_available_at for b in with_estimates)
+        earliest_estimate = min(
+            (t for t in columns.estimated_available_at if t is not None and t > now),
+            default=None
+        )
+        if earliest_estimate is not None:
+            return datetime.fromtimestamp(earliest_estimate)
         
         # Fall back to average LOS prediction
-        occupied_beds = [b for b in beds if b.state == BedState.OCCUPIED]
-        if occupied_beds:
-            avg_los_hours = self.AVG_LOS.get(unit, 48)
+        if BedState.OCCUPIED in states:
             # Assume some beds are near discharge
-            estimated = now + timedelta(hours=avg_los_hours * 0.1)  # 10% of avg LOS
-            return estimated
+            offset = self.NEAR_DISCHARGE_SECONDS.get(unit, self.DEFAULT_AVG_LOS * 360)
+            return datetime.fromtimestamp(now + offset)
         
         return None
     
@@ -257,35 +614,39 @@ class AvailabilityPredictor:
         Returns:
             Tuple of (predicted_count, confidence)
         """
-        beds = self.bed_tracker.get_unit_beds(unit)
-        now = datetime.now()
-        cutoff = now + timedelta(minutes=timeframe_minutes)
+        columns = self.bed_tracker.get_unit_columns(unit)
+        now = time.time()
+        cutoff = now + timeframe_minutes * 60
         
         predicted = 0
         confidence = 0.9
+        if not columns:
+            return predicted, confidence
         
-        # Count beds in cleaning (high confidence)
-        cleaning_beds = [
-            b for b in beds 
-            if b.state == BedState.CLEANING 
-            and b.last_state_change + timedelta(minutes=self.DEFAULT_CLEANING_TIME) <= cutoff
-        ]
-        predicted += len(cleaning_beds)
-        
-        # Count beds with explicit estimated availability
-        with_estimates = [
-            b for b in beds 
-            if b.estimated_available_at 
-            and now < b.estimated_available_at <= cutoff
-        ]
-        predicted += len(with_estimates)
+        # One pass over the columns:
+        # - cleaning beds are ready (high confidence) if cleaning started no
+        #   later than one cleaning time before the cutoff
+        # - beds with an explicit estimate count if it falls inside the window
+        # - occupied beds feed the probabilistic estimate below
+        cleaning_started_by = cutoff - self.CLEANING_SECONDS
+        cleaning_ready = estimated_ready = occupied = 0
+        for state, changed, estimate in zip(
+            columns.states, columns.last_state_change, columns.estimated_available_at
+        ):
+            if state == BedState.CLEANING:
+                if changed <= cleaning_started_by:
+                    cleaning_ready += 1
+            elif state == BedState.OCCUPIED:
+                occupied += 1
+            if estimate is not None and now < estimate <= cutoff:
+                estimated_ready += 1
+        predicted += cleaning_ready + estimated_ready
         
         # Add probabilistic estimate for occupied beds (lower confidence)
-        occupied = sum(1 for b in beds if b.state == BedState.OCCUPIED)
         if occupied > 0:
-            avg_los_hours = self.AVG_LOS.get(unit, 48)
+            avg_los_minutes = self.AVG_LOS_MINUTES.get(unit, self.DEFAULT_AVG_LOS * 60)
             # Probability of discharge in timeframe
-            discharge_prob = timeframe_minutes / (avg_los_hours * 60)
+            discharge_prob = timeframe_minutes / avg_los_minutes
             expected_discharges = occupied * min(discharge_prob, 0.3)  # Cap at 30%
             predicted += int(expected_discharges)
             confidence *= 0.7  # Lower confidence for probabilistic predictions
@@ -300,17 +661,48 @@ class CapacityTrackingSystem:
     This is the main interface used by the Capacity Intelligence Agent.
     """
     
+    # Assessments embed time-based predictions, so even an untouched unit's
+    # cached assessment is rebuilt once it is older than this (seconds)
+    ASSESSMENT_MAX_AGE = 0.5
+    
     def __init__(self):
         self.bed_tracker = BedTracker()
         self.staff_tracker = StaffTracker()
         self.predictor = AvailabilityPredictor(self.bed_tracker)
+        # unit -> (bed unit revision, staff unit revision, built at, assessment)
+        self._assessment_cache: Dict[UnitType, Tuple[int, int, float, CapacityAssessment]] = {}
+    
+    @property
+    def revision(self) -> int:
+        """Monotonic counter that changes whenever bed or staff state changes."""
+        return self.bed_tracker.revision + self.staff_tracker.revision
     
     def get_unit_assessment(self, unit: UnitType) -> CapacityAssessment:
         """
         Generate a complete capacity assessment for a unit.
         
         This is the primary output method for the Capacity Intelligence Agent.
+        Assessments are cached per unit and rebuilt only when that unit's beds
+        or staff changed, or the cached entry is older than ASSESSMENT_MAX_AGE.
         """
+        bed_revision = self.bed_tracker.unit_revisions[unit]
+        staff_revision = self.staff_tracker.unit_revisions[unit]
+        now = time.monotonic()
+        cached = self._assessment_cache.get(unit)
+        if (
+            cached is not None
+            and cached[0] == bed_revision
+            and cached[1] == staff_revision
+            and now - cached[2] < self.ASSESSMENT_MAX_AGE
+        ):
+            return cached[3]
+        
+        assessment = self._build_unit_assessment(unit)
+        self._assessment_cache[unit] = (bed_revision, staff_revision, now, assessment)
+        return assessment
+    
+    def _build_unit_assessment(self, unit: UnitType) -> CapacityAssessment:
+        """Build a fresh assessment for a unit from current tracker state."""
         # Get bed capacity
         unit_capacity = self.bed_tracker.get_unit_capacity(unit)
         
@@ -325,78 +717,85 @@ class CapacityTrackingSystem:
         return CapacityAssessment.from_unit_capacity(unit_capacity, predicted)
     
     def get_all_assessments(self) -> Dict[str, CapacityAssessment]:
-        """Get capacity assessments for all tracked units."""
+        """
+        Get capacity assessments for all units.
+        
+        Every UnitType is reported; units with no beds and no staff get an
+        empty assessment without going through the trackers.
+        """
+        populated = set(self.bed_tracker.tracked_units())
+        populated.update(self.staff_tracker.tracked_units())
+        
         assessments = {}
         for unit in UnitType:
-            assessment = self.get_unit_assessment(unit)
+            if unit in populated:
+                assessment = self.get_unit_assessment(unit)
+            else:
+                assessment = CapacityAssessment.from_unit_capacity(UnitCapacity.empty(unit))
             assessments[unit.value] = assessment
         return assessments
     
     def initialize_demo_data(self):
         """Initialize with demo hospital data for testing."""
+        occupied, available, cleaning = BedState.OCCUPIED, BedState.AVAILABLE, BedState.CLEANING
+        
         # ICU: 10 beds, 80% occupied
-        for i in range(10):
-            bed = BedStatus(
-                bed_id=f"ICU-{i+1:02d}",
-                unit=UnitType.ICU,
-                state=BedState.OCCUPIED if i < 8 else BedState.AVAILABLE,
-                patient_id=f"P-ICU-{i+1}" if i < 8 else None
-            )
-            self.bed_tracker.register_bed(bed)
-        
-        # Ward: 30 beds, 70% occupied
-        for i in range(30):
-            state = BedState.OCCUPIED if i < 21 else BedState.AVAILABLE
-            if i == 21:
-                state = BedState.CLEANING  # One bed being cleaned
-            bed = BedStatus(
-                bed_id=f"WARD-{i+1:02d}",
-                unit=UnitType.WARD,
-                state=state,
-                patient_id=f"P-WARD-{i+1}" if i < 21 else None
-            )
-            self.bed_tracker.register_bed(bed)
+        self.bed_tracker.bulk_register(
+            UnitType.ICU,
+            [f"ICU-{i+1:02d}" for i in range(10)],
+            [occupied] * 8 + [available] * 2,
+            [f"P-ICU-{i+1}" for i in range(8)] + [None] * 2
+        )
+        
+        # Ward: 30 beds, 70% occupied, one bed being cleaned
+        self.bed_tracker.bulk_register(
+            UnitType.WARD,
+            [f"WARD-{i+1:02d}" for i in range(30)],
+            [occupied] * 21 + [cleaning] + [available] * 8,
+            [f"P-WARD-{i+1}" for i in range(21)] + [None] * 9
+        )
         
         # ED: 15 beds, 90% occupied
-        for i in range(15):
-            bed = BedStatus(
-                bed_id=f"ED-{i+1:02d}",
-                unit=UnitType.ED,
-                state=BedState.OCCUPIED if i < 14 else BedState.AVAILABLE,
-                patient_id=f"P-ED-{i+1}" if i < 14 else None
-            )
-            self.bed_tracker.register_bed(bed)
+        self.bed_tracker.bulk_register(
+            UnitType.ED,
+            [f"ED-{i+1:02d}" for i in range(15)],
+            [occupied] * 14 + [available],
+            [f"P-ED-{i+1}" for i in range(14)] + [None]
+        )
         
         # Add some staff
-        for i in range(3):
-            staff = StaffWorkload(
-                staff_id=f"ICU-RN-{i+1}",
-                name=f"ICU Nurse {i+1}",
-                role="nurse",
-                unit=UnitType.ICU,
-                current_patient_count=3 if i < 2 else 2,
-                max_patient_capacity=4
-            )
-            self.staff_tracker.register_staff(staff)
-        
-        for i in range(8):
-            staff = StaffWorkload(
-                staff_id=f"WARD-RN-{i+1}",
-                name=f"Ward Nurse {i+1}",
-                role="nurse",
-                unit=UnitType.WARD,
-                current_patient_count=3 if i < 5 else 2,
-                max_patient_capacity=5
-            )
-            self.staff_tracker.register_staff(staff)
-        
-        for i in range(5):
-            staff = StaffWorkload(
-                staff_id=f"ED-RN-{i+1}",
-                name=f"ED Nurse {i+1}",
-                role="nurse",
-                unit=UnitType.ED,
-                current_patient_count=3,
-                max_patient_capacity=4
-            )
-            self.staff_tracker.register_staff(staff)
+        self.staff_tracker.bulk_register(
+            [
+                StaffWorkload(
+                    staff_id=f"ICU-RN-{i+1}",
+                    name=f"ICU Nurse {i+1}",
+                    role="nurse",
+                    unit=UnitType.ICU,
+                    current_patient_count=3 if i < 2 else 2,
+                    max_patient_capacity=4
+                )
+                for i in range(3)
+            ]
+            + [
+                StaffWorkload(
+                    staff_id=f"WARD-RN-{i+1}",
+                    name=f"Ward Nurse {i+1}",
+                    role="nurse",
+                    unit=UnitType.WARD,
+                    current_patient_count=3 if i < 5 else 2,
+                    max_patient_capacity=5
+                )
+                for i in range(8)
+            ]
+            + [
+                StaffWorkload(
+                    staff_id=f"ED-RN-{i+1}",
+                    name=f"ED Nurse {i+1}",
+                    role="nurse",
+                    unit=UnitType.ED,
+                    current_patient_count=3,
+                    max_patient_capacity=4
+                )
+                for i in range(5)
+            ]
+        )
@@ -12,11 +12,13 @@ This agent:
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 import sys
 import os
+import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from .models import (
@@ -30,6 +32,53 @@ from backend.reasoning.mcda import MCDAScores, MCDAAnalyzer, MCDAWeights
 from backend.reasoning.decision_engine import ActionType, DecisionEngine
 
 
+# Observation timestamps are shared within this window (seconds), so bursts of
+# recommendations don't each read the clock and format an ISO string
+_TIMESTAMP_RESOLUTION = 0.001
+_timestamp_cache = [float("-inf"), ""]  # [monotonic time, isoformat string]
+
+
+def _now_iso() -> str:
+    """Current time as an ISO string, reused for up to _TIMESTAMP_RESOLUTION seconds."""
+    now = time.monotonic()
+    if now - _timestamp_cache[0] > _TIMESTAMP_RESOLUTION:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.now().isoformat()
+    return _timestamp_cache[1]
+
+
+# Demo inputs used when a request carries no patient or capacity data
+_DEMO_PATIENT_CONTEXT: Dict[str, Any] = {
+    "patient_id": "P-DEMO-001",
+    "acuity_level": 3,
+    "wait_time_minutes": 45,
+    "current_location": "ED",
+    "trajectory": "stable",
+    "preferred_unit": "Ward"
+}
+
+_DEMO_CAPACITY: Dict[str, Dict[str, Any]] = {
+    "ICU": {
+        "capacity_score": 35,
+        "current_occupancy": 0.85,
+        "staff_ratio": 2.5,
+        "predicted_availability": None
+    },
+    "Ward": {
+        "capacity_score": 60,
+        "current_occupancy": 0.70,
+        "staff_ratio": 4.0,
+        "predicted_availability": True
+    },
+    "ED": {
+        "capacity_score": 25,
+        "current_occupancy": 0.92,
+        "staff_ratio": 3.0,
+        "predicted_availability": None
+    }
+}
+
+
 # ============================================================================
 # Minimal BaseAgent stub (will be replaced when Ashu's base_agent.py is ready)
 # ============================================================================
@@ -99,6 +148,9 @@ class FlowOrchestratorAgent(BaseAgent):
         recommendation = agent.get_recommendation(patient_id="P001")
     """
     
+    # Maximum patients with a cached risk assessment (least recently used evicted)
+    RISK_CACHE_SIZE = 2048
+    
     def __init__(self, event_bus=None, state_manager=None, weights: Optional[MCDAWeights] = None):
         super().__init__(event_bus, state_manager)
         self.mcda_analyzer = MCDAAnalyzer(weights)
@@ -108,15 +160,25 @@ class FlowOrchestratorAgent(BaseAgent):
         
         # Will hold capacity assessments from Capacity Intelligence Agent
         self._capacity_cache: Dict[str, Any] = {}
-        self._risk_cache: Dict[str, Any] = {}
+        self._capacity_unit_data: List[Dict[str, Any]] = []  # _capacity_cache, normalized
+        self._risk_cache: "OrderedDict[str, Any]" = OrderedDict()
     
     def set_capacity_assessments(self, assessments: Dict[str, Any]) -> None:
-        """Update cached capacity assessments from Capacity Intelligence Agent."""
+        """
+        Update cached capacity assessments from Capacity Intelligence Agent.
+        
+        Assessments are normalized to unit data dicts here, once, rather
+        than on every recommendation that uses the cache.
+        """
         self._capacity_cache = assessments
+        self._capacity_unit_data = self._normalize_capacity(assessments)
     
     def set_risk_assessment(self, patient_id: str, risk: Dict[str, Any]) -> None:
         """Update cached risk assessment from Risk Monitor Agent."""
         self._risk_cache[patient_id] = risk
+        self._risk_cache.move_to_end(patient_id)
+        if len(self._risk_cache) > self.RISK_CACHE_SIZE:
+            self._risk_cache.popitem(last=False)
     
     async def observe(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -133,27 +195,37 @@ class FlowOrchestratorAgent(BaseAgent):
         Returns:
             Observations dict with patient, capacity, and risk data
         """
+        # The state manager is the only async dependency; fetch from it here
+        # and leave the rest to the synchronous path
+        if not context.get("patient_context") and self.state:
+            patient_data = await self.state.get(f"patient:{context.get('patient_id')}")
+            if patient_data:
+                context = {**context, "patient_context": patient_data}
+        
+        return self._observe_sync(context)
+    
+    def _observe_sync(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Gather data for flow decision from the context and local caches (see observe)."""
         patient_id = context.get("patient_id")
         
         observations = {
             "patient_id": patient_id,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
         
-        # Get patient context from request or state
+        # Get patient context from request
         patient_context = context.get("patient_context", {})
-        if not patient_context and self.state:
-            # Try to get from state manager
-            patient_data = await self.state.get(f"patient:{patient_id}")
-            if patient_data:
-                patient_context = patient_data
-        
         observations["patient"] = patient_context or self._get_demo_patient_context()
         
         # Get capacity assessments
         capacity = context.get("capacity_assessments")
+        unit_data_list = None
         if not capacity:
-            capacity = self._capacity_cache or self._get_demo_capacity()
+            if self._capacity_cache:
+                capacity = self._capacity_cache
+                unit_data_list = self._capacity_unit_data
+            else:
+                capacity = self._get_demo_capacity()
         
         observations["capacity"] = capacity
         
@@ -161,24 +233,52 @@ class FlowOrchestratorAgent(BaseAgent):
         risk = context.get("risk_assessment")
         if not risk and patient_id:
             risk = self._risk_cache.get(patient_id)
+            if risk is not None:
+                self._risk_cache.move_to_end(patient_id)
         
         observations["risk"] = risk or {"risk_score": 50, "trajectory": "stable"}
         
-        # Get available units
-        available_units = []
-        for unit_name, cap_data in capacity.items():
-            if isinstance(cap_data, dict):
-                score = cap_data.get("capacity_score", 50)
-            else:
-                score = getattr(cap_data, "capacity_score", 50)
-            
-            if score > 20:  # Has some capacity
-                available_units.append(unit_name)
-        
-        observations["available_units"] = available_units
+        # Normalize unit data once and derive available units from it
+        if unit_data_list is None:
+            unit_data_list = self._normalize_capacity(capacity)
+        observations["unit_data"] = unit_data_list
+        observations["available_units"] = [
+            u["unit"] for u in unit_data_list
+            if u["capacity_score"] > 20  # Has some capacity
+        ]
         
         return observations
     
+    @staticmethod
+    def _normalize_capacity(capacity: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Flatten capacity assessments (dicts or CapacityAssessment objects)
+        into the unit data dicts used for scenario simulation.
+        """
+        return [
+            FlowOrchestratorAgent._unit_view(unit_name, cap_data)
+            for unit_name, cap_data in capacity.items()
+        ]
+    
+    @staticmethod
+    def _unit_view(unit_name: str, cap_data: Any) -> Dict[str, Any]:
+        """Read the fields the flow logic needs from one unit's capacity data."""
+        if isinstance(cap_data, dict):
+            return {
+                "unit": unit_name,
+                "capacity_score": cap_data.get("capacity_score", 50),
+                "current_occupancy": cap_data.get("current_occupancy", 0.7),
+                "staff_ratio": cap_data.get("staff_ratio", 1.0),
+                "predicted_availability": cap_data.get("predicted_availability")
+            }
+        return {
+            "unit": unit_name,
+            "capacity_score": getattr(cap_data, "capacity_score", 50),
+            "current_occupancy": getattr(cap_data, "current_occupancy", 0.7),
+            "staff_ratio": getattr(cap_data, "staff_ratio", 1.0),
+            "predicted_availability": getattr(cap_data, "predicted_availability", None)
+        }
+    
     async def decide(self, observations: Dict[str, Any]) -> FlowRecommendation:
         """
         Make flow/placement recommendation based on observations.
@@ -188,31 +288,21 @@ class FlowOrchestratorAgent(BaseAgent):
         Returns:
             FlowRecommendation with action, alternatives, and MCDA scores
         """
+        return self._decide_sync(observations)
+    
+    def _decide_sync(self, observations: Dict[str, Any]) -> FlowRecommendation:
+        """Make flow/placement recommendation (see decide)."""
         patient_id = observations.get("patient_id", "unknown")
         patient_context = observations.get("patient", {})
+        current_location = patient_context.get("current_location", "ED")
         capacity_data = observations.get("capacity", {})
         risk_data = observations.get("risk", {})
         available_units = observations.get("available_units", [])
         
-        # Step 1: Prepare unit data for scenario simulation
-        unit_data_list = []
-        for unit_name, cap_data in capacity_data.items():
-            if isinstance(cap_data, dict):
-                unit_data_list.append({
-                    "unit": unit_name,
-                    "capacity_score": cap_data.get("capacity_score", 50),
-                    "current_occupancy": cap_data.get("current_occupancy", 0.7),
-                    "staff_ratio": cap_data.get("staff_ratio", 1.0),
-                    "predicted_availability": cap_data.get("predicted_availability")
-                })
-            else:
-                unit_data_list.append({
-                    "unit": unit_name,
-                    "capacity_score": getattr(cap_data, "capacity_score", 50),
-                    "current_occupancy": getattr(cap_data, "current_occupancy", 0.7),
-                    "staff_ratio": getattr(cap_data, "staff_ratio", 1.0),
-                    "predicted_availability": getattr(cap_data, "predicted_availability", None)
-                })
+        # Step 1: Prepare unit data for scenario simulation (normalized in observe)
+        unit_data_list = observations.get("unit_data")
+        if unit_data_list is None:
+            unit_data_list = self._normalize_capacity(capacity_data)
         
         # Step 2: Simulate placement options
         placement_options = self.scenario_simulator.simulate_placement_scenarios(
@@ -221,25 +311,25 @@ class FlowOrchestratorAgent(BaseAgent):
             risk_context=risk_data
         )
         
-        # Step 3: Run timing analysis (what-if scenarios)
-        best_capacity = max((u.get("capacity_score", 0) for u in unit_data_list), default=50)
+        # Step 3: Summarize capacity across units
+        # Single pass for the best score and whether any unit predicts availability
+        best_capacity = unit_data_list[0]["capacity_score"] if unit_data_list else 50
+        any_predicted = False
+        for u in unit_data_list:
+            score = u["capacity_score"]
+            if score > best_capacity:
+                best_capacity = score
+            if not any_predicted and u["predicted_availability"]:
+                any_predicted = True
         capacity_context = {
             "capacity_score": best_capacity,
-            "predicted_availability": any(u.get("predicted_availability") for u in unit_data_list)
+            "predicted_availability": any_predicted
         }
         
-        timing_scenarios = self.scenario_simulator.run_timing_analysis(
-            patient_context=patient_context,
-            capacity_context=capacity_context
-        )
-        
-        # Step 4: Determine best option
+        # Step 4: Determine best placement
         best_placement, alternatives, placement_reasoning = \
             self.scenario_comparator.compare_placement_options(placement_options)
         
-        best_timing, timing_reasoning = \
-            self.scenario_comparator.compare_wait_scenarios(timing_scenarios)
-        
         # Step 5: Calculate final MCDA scores
         if best_placement and best_placement.mcda_scores:
             mcda_scores = best_placement.mcda_scores
@@ -250,16 +340,42 @@ class FlowOrchestratorAgent(BaseAgent):
                 risk_context=risk_data
             )
         
-        # Step 6: Determine action and confidence
+        # Critical priority always escalates, so the wait scenarios would be
+        # discarded; skip the timing analysis entirely
+        if mcda_scores.priority_level == "CRITICAL":
+            return FlowRecommendation(
+                patient_id=patient_id,
+                recommended_action=ActionType.ESCALATE,
+                recommended_unit=None,
+                alternative_options=alternatives,
+                confidence=0.9,
+                mcda_scores=mcda_scores,
+                reasoning=" ".join(p for p in (
+                    placement_reasoning,
+                    "Critical priority: escalating without wait-scenario analysis."
+                ) if p),
+                urgent=True
+            )
+        
+        # Step 6: Run timing analysis (what-if scenarios)
+        timing_scenarios = self.scenario_simulator.run_timing_analysis(
+            patient_context=patient_context,
+            capacity_context=capacity_context
+        )
+        
+        best_timing, timing_reasoning = \
+            self.scenario_comparator.compare_wait_scenarios(timing_scenarios)
+        
+        # Step 7: Determine action and confidence
         action, recommended_unit, confidence = self._determine_action(
             best_placement=best_placement,
             best_timing=best_timing,
             mcda_scores=mcda_scores,
-            patient_context=patient_context
+            current_location=current_location
         )
         
-        # Step 7: Build reasoning
-        reasoning = f"{placement_reasoning} {timing_reasoning}"
+        # Step 8: Build reasoning
+        reasoning = " ".join(p for p in (placement_reasoning, timing_reasoning) if p)
         
         return FlowRecommendation(
             patient_id=patient_id,
@@ -268,7 +384,7 @@ class FlowOrchestratorAgent(BaseAgent):
             alternative_options=alternatives,
             confidence=confidence,
             mcda_scores=mcda_scores,
-            reasoning=reasoning.strip(),
+            reasoning=reasoning,
             scenarios_analyzed=timing_scenarios,
             wait_recommendation=best_timing.wait_time_minutes if best_timing and best_timing.wait_time_minutes > 0 else None,
             urgent=mcda_scores.priority_level in ["CRITICAL", "HIGH"]
@@ -279,7 +395,7 @@ class FlowOrchestratorAgent(BaseAgent):
         best_placement: Optional[PlacementOption],
         best_timing: Optional[ScenarioOutcome],
         mcda_scores: MCDAScores,
-        patient_context: Dict[str, Any]
+        current_location: str = "ED"
     ) -> tuple:
         """Determine recommended action, unit, and confidence."""
         
@@ -296,7 +412,6 @@ class FlowOrchestratorAgent(BaseAgent):
             unit = best_placement.unit
             confidence = min(0.95, best_placement.composite_viability_score / 100)
             
-            current_location = patient_context.get("current_location", "ED")
             if current_location == "ED":
                 return (ActionType.ADMIT, unit, confidence)
             else:
@@ -320,9 +435,8 @@ class FlowOrchestratorAgent(BaseAgent):
         Get flow recommendation (sync method).
         
         For testing and integration without async infrastructure.
+        Runs observe/decide synchronously; no event loop is created.
         """
-        import asyncio
-        
         context = {
             "patient_id": patient_id,
             "patient_context": patient_context or self._get_demo_patient_context(),
@@ -330,14 +444,7 @@ class FlowOrchestratorAgent(BaseAgent):
             "risk_assessment": risk_assessment
         }
         
-        # Run async methods synchronously
-        loop = asyncio.new_event_loop()
-        try:
-            observations = loop.run_until_complete(self.observe(context))
-            recommendation = loop.run_until_complete(self.decide(observations))
-            return recommendation
-        finally:
-            loop.close()
+        return self._decide_sync(self._observe_sync(context))
     
     def run_what_if(
         self,
@@ -369,37 +476,11 @@ class FlowOrchestratorAgent(BaseAgent):
     
     def _get_demo_patient_context(self) -> Dict[str, Any]:
         """Get demo patient context for testing."""
-        return {
-            "patient_id": "P-DEMO-001",
-            "acuity_level": 3,
-            "wait_time_minutes": 45,
-            "current_location": "ED",
-            "trajectory": "stable",
-            "preferred_unit": "Ward"
-        }
+        return _DEMO_PATIENT_CONTEXT.copy()
     
     def _get_demo_capacity(self) -> Dict[str, Dict[str, Any]]:
-        """Get demo capacity data for testing."""
-        return {
-            "ICU": {
-                "capacity_score": 35,
-                "current_occupancy": 0.85,
-                "staff_ratio": 2.5,
-                "predicted_availability": None
-            },
-            "Ward": {
-                "capacity_score": 60,
-                "current_occupancy": 0.70,
-                "staff_ratio": 4.0,
-                "predicted_availability": True
-            },
-            "ED": {
-                "capacity_score": 25,
-                "current_occupancy": 0.92,
-                "staff_ratio": 3.0,
-                "predicted_availability": None
-            }
-        }
+        """Get demo capacity data for testing (per-unit dicts are shared, treat as read-only)."""
+        return _DEMO_CAPACITY.copy()
 
 
 # Convenience function for quick testing
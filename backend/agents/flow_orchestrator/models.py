@@ -6,7 +6,7 @@ Models for patient placement decisions and flow optimization.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Any, Mapping
 from enum import Enum
 
 import sys
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from backend.reasoning.mcda import MCDAScores
 from backend.reasoning.decision_engine import ActionType
+from backend.utils.serialization import ReadOnlyDict, dumps_bytes
 
 
 class PlacementStatus(str, Enum):
@@ -25,7 +26,11 @@ class PlacementStatus(str, Enum):
     PENDING = "pending"
 
 
-@dataclass
+# Statuses for which a placement option is considered viable
+_VIABLE_STATUSES = frozenset({PlacementStatus.AVAILABLE, PlacementStatus.PENDING})
+
+
+@dataclass(slots=True)
 class PlacementOption:
     """
     A possible patient placement option with associated scores.
@@ -44,32 +49,40 @@ class PlacementOption:
     constraints: List[str] = field(default_factory=list)
     notes: str = ""
     
+    _dict_cache: Optional[ReadOnlyDict] = field(default=None, init=False, repr=False, compare=False)
+    # Cached composite_viability_score
+    _viability_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
     @property
     def is_viable(self) -> bool:
         """Check if this option is currently viable."""
-        return self.status in [PlacementStatus.AVAILABLE, PlacementStatus.PENDING]
+        return self.status in _VIABLE_STATUSES
     
     @property
     def composite_viability_score(self) -> float:
-        """Calculate overall viability score."""
+        """Calculate overall viability score (computed once; options are not mutated)."""
+        if self._viability_cache is not None:
+            return self._viability_cache
+        
         if not self.is_viable:
+            self._viability_cache = 0.0
             return 0.0
         
         base = self.mcda_scores.composite_score if self.mcda_scores else 50.0
         
-        # Penalize long waits
-        if self.estimated_wait_minutes > 60:
-            base *= 0.7
-        elif self.estimated_wait_minutes > 30:
-            base *= 0.85
+        # Penalize long waits and constraints as straight multipliers
+        wait = self.estimated_wait_minutes
+        wait_mult = 0.7 if wait > 60 else (0.85 if wait > 30 else 1.0)
+        constraint_mult = max(0.5, 1 - len(self.constraints) * 0.1)
         
-        # Penalize constraints
-        base *= max(0.5, 1 - len(self.constraints) * 0.1)
-        
-        return base
+        self._viability_cache = base * wait_mult * constraint_mult
+        return self._viability_cache
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    def to_dict(self) -> Mapping[str, Any]:
+        if self._dict_cache is not None:
+            return self._dict_cache
+        
+        self._dict_cache = ReadOnlyDict({
             "option_id": self.option_id,
             "unit": self.unit,
             "bed_id": self.bed_id,
@@ -78,14 +91,15 @@ class PlacementOption:
             "capacity_score": round(self.capacity_score, 2),
             "staff_ratio": round(self.staff_ratio, 3),
             "estimated_wait_minutes": self.estimated_wait_minutes,
-            "constraints": self.constraints,
+            "constraints": tuple(self.constraints),
             "notes": self.notes,
             "is_viable": self.is_viable,
             "composite_viability_score": round(self.composite_viability_score, 2)
-        }
+        })
+        return self._dict_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioOutcome:
     """
     Result of a what-if scenario simulation.
@@ -103,18 +117,24 @@ class ScenarioOutcome:
     expected_risks: List[str] = field(default_factory=list)
     probability_of_better_outcome: float = 0.5
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    _dict_cache: Optional[ReadOnlyDict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> Mapping[str, Any]:
+        if self._dict_cache is not None:
+            return self._dict_cache
+        
+        self._dict_cache = ReadOnlyDict({
             "scenario_id": self.scenario_id,
             "description": self.description,
             "wait_time_minutes": self.wait_time_minutes,
             "predicted_capacity_score": round(self.predicted_capacity_score, 2),
             "predicted_wait_for_bed": self.predicted_wait_for_bed,
             "risk_level": self.risk_level,
-            "expected_benefits": self.expected_benefits,
-            "expected_risks": self.expected_risks,
+            "expected_benefits": tuple(self.expected_benefits),
+            "expected_risks": tuple(self.expected_risks),
             "probability_of_better_outcome": round(self.probability_of_better_outcome, 3)
-        }
+        })
+        return self._dict_cache
     
     @property
     def is_favorable(self) -> bool:
@@ -125,7 +145,7 @@ class ScenarioOutcome:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowRecommendation:
     """
     Output from the Flow Orchestrator Agent.
@@ -154,20 +174,38 @@ class FlowRecommendation:
     wait_recommendation: Optional[int] = None  # Minutes to wait, if applicable
     urgent: bool = False
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    _dict_cache: Optional[ReadOnlyDict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Keep alternatives ranked (viable first, then by viability score) so
+        # best_alternative is a lookup rather than a scan
+        self.alternative_options.sort(
+            key=lambda o: (o.is_viable, o.composite_viability_score),
+            reverse=True
+        )
+    
+    def to_dict(self) -> Mapping[str, Any]:
+        if self._dict_cache is not None:
+            return self._dict_cache
+        
+        self._dict_cache = ReadOnlyDict({
             "patient_id": self.patient_id,
             "recommended_action": self.recommended_action.value,
             "recommended_unit": self.recommended_unit,
-            "alternative_options": [opt.to_dict() for opt in self.alternative_options],
+            "alternative_options": tuple(opt.to_dict() for opt in self.alternative_options),
             "confidence": round(self.confidence, 3),
             "mcda_scores": self.mcda_scores.to_dict() if self.mcda_scores else None,
             "reasoning": self.reasoning,
-            "scenarios_analyzed": [s.to_dict() for s in self.scenarios_analyzed],
+            "scenarios_analyzed": tuple(s.to_dict() for s in self.scenarios_analyzed),
             "timestamp": self.timestamp.isoformat(),
             "wait_recommendation": self.wait_recommendation,
             "urgent": self.urgent
-        }
+        })
+        return self._dict_cache
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes, using orjson when installed."""
+        return dumps_bytes(self.to_dict())
     
     @property
     def priority_level(self) -> str:
@@ -179,7 +217,6 @@ class FlowRecommendation:
     @property
     def best_alternative(self) -> Optional[PlacementOption]:
         """Get the best alternative if primary recommendation fails."""
-        viable = [opt for opt in self.alternative_options if opt.is_viable]
-        if not viable:
-            return None
-        return max(viable, key=lambda x: x.composite_viability_score)
+        if self.alternative_options and self.alternative_options[0].is_viable:
+            return self.alternative_options[0]
+        return None
@@ -9,9 +9,11 @@ Supports questions like:
 - "What happens if we prioritize this patient?"
 """
 
+import heapq
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 
 import sys
 import os
@@ -21,6 +23,87 @@ from .models import ScenarioOutcome, PlacementOption, PlacementStatus
 from backend.reasoning.mcda import MCDAScores, MCDAAnalyzer
 
 
+# Capacity trend -> (capacity points per minute of waiting, probability of a better outcome)
+_TREND_TABLE = {
+    "improving": (0.5, 0.7),
+    "declining": (-0.3, 0.3),
+    "stable": (0.15, 0.5),  # Slight improvement tendency
+}
+
+# Risk of waiting, by patient band: (wait threshold in minutes,
+# (level at or under the threshold, level over it))
+_WAIT_RISK_BANDS = (
+    (15, ("MEDIUM", "HIGH")),  # acuity >= 4 or risk >= 70
+    (30, ("LOW", "MEDIUM")),   # acuity >= 3 or risk >= 50
+    (60, ("LOW", "MEDIUM")),   # everyone else
+)
+
+# Predicted capacity score tiers -> additional minutes to wait for a bed
+_CAPACITY_WAIT_THRESHOLDS = (30, 50, 70)
+_CAPACITY_WAIT_TIERS = (45, 20, 10, 0)
+
+# Unit capacity score tiers -> (status, wait estimate); the lowest tier
+# depends on predicted availability and is resolved in _score_unit
+_PLACEMENT_THRESHOLDS = (30, 50)
+_PLACEMENT_TIERS = (
+    None,
+    (PlacementStatus.CONSTRAINED, 15),
+    (PlacementStatus.AVAILABLE, 0),
+)
+
+
+def _score_unit(
+    capacity_score: float,
+    occupancy: float,
+    staff_ratio: float,
+    predicted_availability: bool,
+    missing_isolation: bool
+) -> Tuple[PlacementStatus, int, List[str]]:
+    """
+    Threshold scoring for one unit: (status, wait estimate, constraints).
+    
+    Kept free of dict lookups so it can be called in a tight loop.
+    """
+    # Determine status
+    tier = _PLACEMENT_TIERS[bisect_right(_PLACEMENT_THRESHOLDS, capacity_score)]
+    if tier is not None:
+        status, wait_estimate = tier
+    elif predicted_availability:
+        status, wait_estimate = PlacementStatus.PENDING, 30
+    else:
+        status, wait_estimate = PlacementStatus.UNAVAILABLE, 60
+    
+    # Check for constraints
+    constraints = []
+    if occupancy > 0.9:
+        constraints.append("High occupancy")
+    if staff_ratio > 5:
+        constraints.append("Low staffing")
+    if missing_isolation:
+        constraints.append("No isolation beds available")
+    
+    return status, wait_estimate, constraints
+
+
+def _policy_numbers(
+    name: str,
+    values: Any,
+    count: Optional[int] = None,
+    integral: bool = False
+) -> Tuple[float, ...]:
+    """Validate a ScenarioSimulator policy entry as a sequence of numbers."""
+    if isinstance(values, (str, bytes, dict)) or not hasattr(values, "__iter__"):
+        raise ValueError(f"{name} must be a sequence of numbers")
+    values = tuple(values)
+    kinds = (int,) if integral else (int, float)
+    if any(isinstance(v, bool) or not isinstance(v, kinds) for v in values):
+        kind = "integers" if integral else "numbers"
+        raise ValueError(f"{name} must contain only {kind}")
+    if count is not None and len(values) != count:
+        raise ValueError(f"{name} needs {count} values")
+    return values
+
+
 class ScenarioSimulator:
     """
     Simulates what-if scenarios for patient placement.
@@ -30,10 +113,88 @@ class ScenarioSimulator:
     """
     
     # Time scenarios to evaluate by default
-    DEFAULT_WAIT_TIMES = [0, 15, 30, 60]  # minutes
+    DEFAULT_WAIT_TIMES = (0, 15, 30, 60)  # minutes
+    
+    # Shared by simulators created without an analyzer, so they also share
+    # its criterion cache
+    _default_mcda_analyzer: Optional[MCDAAnalyzer] = None
     
     def __init__(self, mcda_analyzer: Optional[MCDAAnalyzer] = None):
-        self.mcda_analyzer = mcda_analyzer or MCDAAnalyzer()
+        if mcda_analyzer is None:
+            if ScenarioSimulator._default_mcda_analyzer is None:
+                ScenarioSimulator._default_mcda_analyzer = MCDAAnalyzer()
+            mcda_analyzer = ScenarioSimulator._default_mcda_analyzer
+        self.mcda_analyzer = mcda_analyzer
+        
+        # Wait-scenario policy tables (see apply_policy)
+        self._trend_table = _TREND_TABLE
+        self._wait_risk_bands = _WAIT_RISK_BANDS
+        self._capacity_wait_thresholds = _CAPACITY_WAIT_THRESHOLDS
+        self._capacity_wait_tiers = _CAPACITY_WAIT_TIERS
+    
+    def apply_policy(self, policy: Dict[str, Any]) -> None:
+        """
+        Specialize wait-scenario simulation for a facility policy.
+        
+        The policy values are folded into the lookup tables the simulator
+        reads, so simulation cost does not depend on the policy. Keys left
+        out keep their current values.
+        
+        Args:
+            policy: Any of
+                trend_rates: {trend: (capacity points per minute, probability
+                    of a better outcome)}, merged over the current rates
+                wait_risk_thresholds: (high, medium, low) band wait cutoffs
+                    in minutes
+                bed_wait_thresholds: ascending predicted capacity cutoffs
+                bed_wait_minutes: bed waits for each capacity tier, lowest
+                    tier first (one more than bed_wait_thresholds)
+        
+        Raises:
+            ValueError: If the policy has unknown keys or malformed values
+        """
+        unknown = set(policy) - {
+            "trend_rates", "wait_risk_thresholds", "bed_wait_thresholds", "bed_wait_minutes"
+        }
+        if unknown:
+            raise ValueError(f"Unknown policy keys: {', '.join(sorted(unknown))}")
+        
+        # Build every table before replacing any, so a bad policy changes nothing
+        trend_table = self._trend_table
+        if "trend_rates" in policy:
+            trend_rates = policy["trend_rates"]
+            if not isinstance(trend_rates, dict):
+                raise ValueError("trend_rates must map trend names to (rate, probability)")
+            trend_table = dict(trend_table)
+            for trend, entry in trend_rates.items():
+                rate, prob = _policy_numbers(f"trend_rates[{trend!r}]", entry, count=2)
+                trend_table[trend] = (float(rate), float(prob))
+        
+        wait_risk_bands = self._wait_risk_bands
+        if "wait_risk_thresholds" in policy:
+            risk_thresholds = _policy_numbers(
+                "wait_risk_thresholds", policy["wait_risk_thresholds"], count=len(wait_risk_bands)
+            )
+            wait_risk_bands = tuple(
+                (threshold, levels)
+                for threshold, (_, levels) in zip(risk_thresholds, wait_risk_bands)
+            )
+        
+        thresholds = self._capacity_wait_thresholds
+        if "bed_wait_thresholds" in policy:
+            thresholds = _policy_numbers("bed_wait_thresholds", policy["bed_wait_thresholds"])
+        tiers = self._capacity_wait_tiers
+        if "bed_wait_minutes" in policy:
+            tiers = _policy_numbers("bed_wait_minutes", policy["bed_wait_minutes"], integral=True)
+        if list(thresholds) != sorted(thresholds):
+            raise ValueError("bed_wait_thresholds must be ascending")
+        if len(tiers) != len(thresholds) + 1:
+            raise ValueError("bed_wait_minutes needs one more value than bed_wait_thresholds")
+        
+        self._trend_table = trend_table
+        self._wait_risk_bands = wait_risk_bands
+        self._capacity_wait_thresholds = thresholds
+        self._capacity_wait_tiers = tiers
     
     def simulate_wait_scenario(
         self,
@@ -54,81 +215,94 @@ class ScenarioSimulator:
         Returns:
             ScenarioOutcome with predicted results
         """
-        scenario_id = f"wait_{wait_minutes}min"
-        
-        # Project capacity score based on trend
-        if capacity_trend == "improving":
-            improvement_rate = 0.5  # points per minute
-            predicted_capacity = min(100, current_capacity_score + wait_minutes * improvement_rate)
-            prob_better = 0.7
-        elif capacity_trend == "declining":
-            decline_rate = 0.3  # points per minute
-            predicted_capacity = max(0, current_capacity_score - wait_minutes * decline_rate)
-            prob_better = 0.3
+        return self._simulate_wait_batch(
+            current_capacity_score, patient_context, [wait_minutes], capacity_trend
+        )[0]
+    
+    def _simulate_wait_batch(
+        self,
+        current_capacity_score: float,
+        patient_context: Dict[str, Any],
+        wait_times: Sequence[int],
+        capacity_trend: str = "stable"
+    ) -> List[ScenarioOutcome]:
+        """
+        Simulate several wait times for one patient (see simulate_wait_scenario).
+        
+        Everything that depends only on the patient and trend is worked out
+        once, leaving a short loop over the wait times.
+        """
+        # Project capacity score based on trend (unknown trends count as stable)
+        trend_table = self._trend_table
+        rate, base_prob_better = trend_table.get(capacity_trend, trend_table["stable"])
+        if rate < 0:
+            predicted_scores = [max(0, current_capacity_score + w * rate) for w in wait_times]
         else:
-            # Stable with slight improvement tendency
-            predicted_capacity = min(100, current_capacity_score + wait_minutes * 0.15)
-            prob_better = 0.5
+            predicted_scores = [min(100, current_capacity_score + w * rate) for w in wait_times]
+        improving = capacity_trend == "improving"
         
-        # Calculate risk level based on patient acuity and wait time
+        # Risk level of waiting depends on patient acuity and wait time:
+        # waits longer than the threshold move to the higher level
         acuity = patient_context.get("acuity_level", 3)
         risk = patient_context.get("risk_score", 50)
         
-        if wait_minutes == 0:
-            risk_level = "LOW"
-        elif acuity >= 4 or risk >= 70:
-            risk_level = "HIGH" if wait_minutes > 15 else "MEDIUM"
-        elif acuity >= 3 or risk >= 50:
-            risk_level = "MEDIUM" if wait_minutes > 30 else "LOW"
-        else:
-            risk_level = "LOW" if wait_minutes <= 60 else "MEDIUM"
-        
-        # Estimate additional wait for bed
-        if predicted_capacity >= 70:
-            additional_wait = 0
-        elif predicted_capacity >= 50:
-            additional_wait = 10
-        elif predicted_capacity >= 30:
-            additional_wait = 20
-        else:
-            additional_wait = 45
-        
-        # Generate benefits and risks
-        benefits = []
-        risks = []
-        
-        if capacity_trend == "improving" and wait_minutes > 0:
-            benefits.append("Capacity expected to improve")
-            if predicted_capacity > current_capacity_score + 10:
-                benefits.append("Better bed options likely")
-        
-        if wait_minutes > 0:
-            if patient_context.get("trajectory") == "deteriorating":
-                risks.append("Patient condition may worsen")
-                risk_level = "HIGH"
-                prob_better = max(0.1, prob_better - 0.3)
+        band = 0 if acuity >= 4 or risk >= 70 else (1 if acuity >= 3 or risk >= 50 else 2)
+        risk_threshold, risk_levels = self._wait_risk_bands[band]
+        
+        # Risks of waiting at all
+        deteriorating = patient_context.get("trajectory") == "deteriorating"
+        wait_risks = []
+        if deteriorating:
+            wait_risks.append("Patient condition may worsen")
+        if patient_context.get("boarding_in_ed"):
+            wait_risks.append("Extended ED boarding")
+        if acuity >= 4:
+            wait_risks.append("Delayed care for high-acuity patient")
+        
+        immediate_risks = ["Current capacity constraints"] if current_capacity_score < 50 else []
+        wait_thresholds = self._capacity_wait_thresholds
+        wait_tiers = self._capacity_wait_tiers
+        
+        outcomes = []
+        for wait_minutes, predicted_capacity in zip(wait_times, predicted_scores):
+            prob_better = base_prob_better
             
-            if patient_context.get("boarding_in_ed"):
-                risks.append("Extended ED boarding")
+            # Not waiting is always low risk
+            risk_level = risk_levels[wait_minutes > risk_threshold] if wait_minutes != 0 else "LOW"
             
-            if acuity >= 4:
-                risks.append("Delayed care for high-acuity patient")
-        else:
-            benefits.append("Immediate action")
-            if current_capacity_score < 50:
-                risks.append("Current capacity constraints")
-        
-        return ScenarioOutcome(
-            scenario_id=scenario_id,
-            description=f"Wait {wait_minutes} minutes before placement",
-            wait_time_minutes=wait_minutes,
-            predicted_capacity_score=predicted_capacity,
-            predicted_wait_for_bed=additional_wait,
-            risk_level=risk_level,
-            expected_benefits=benefits,
-            expected_risks=risks,
-            probability_of_better_outcome=prob_better
-        )
+            # Estimate additional wait for bed
+            additional_wait = wait_tiers[bisect_right(wait_thresholds, predicted_capacity)]
+            
+            # Generate benefits and risks
+            benefits = []
+            
+            if improving and wait_minutes > 0:
+                benefits.append("Capacity expected to improve")
+                if predicted_capacity > current_capacity_score + 10:
+                    benefits.append("Better bed options likely")
+            
+            if wait_minutes > 0:
+                risks = list(wait_risks)
+                if deteriorating:
+                    risk_level = "HIGH"
+                    prob_better = max(0.1, prob_better - 0.3)
+            else:
+                benefits.append("Immediate action")
+                risks = list(immediate_risks)
+            
+            outcomes.append(ScenarioOutcome(
+                scenario_id=f"wait_{wait_minutes}min",
+                description=f"Wait {wait_minutes} minutes before placement",
+                wait_time_minutes=wait_minutes,
+                predicted_capacity_score=predicted_capacity,
+                predicted_wait_for_bed=additional_wait,
+                risk_level=risk_level,
+                expected_benefits=benefits,
+                expected_risks=risks,
+                probability_of_better_outcome=prob_better
+            ))
+        
+        return outcomes
     
     def simulate_placement_scenarios(
         self,
@@ -145,73 +319,95 @@ class ScenarioSimulator:
             risk_context: Risk assessment data
         
         Returns:
-            List of PlacementOptions ranked by viability
+            List of PlacementOptions, one per unit in the given order
+            (ScenarioComparator.compare_placement_options does the ranking)
         """
-        options = []
+        # Units are scored independently; the work per unit is a few
+        # microseconds of pure Python, so a plain loop beats a thread pool
+        isolation_required = bool(patient_context.get("isolation_required"))
+        context_key = self.mcda_analyzer.criteria_context_key(patient_context, risk_context)
+        options = [
+            self.simulate_placement(
+                unit_data, patient_context, risk_context, isolation_required, context_key
+            )
+            for unit_data in available_units
+        ]
         
-        for unit_data in available_units:
-            unit_name = unit_data.get("unit", "Unknown")
-            capacity_score = unit_data.get("capacity_score", 50)
-            
-            # Calculate MCDA scores for this placement
+        return options
+    
+    def simulate_placement(
+        self,
+        unit_data: Dict[str, Any],
+        patient_context: Dict[str, Any],
+        risk_context: Optional[Dict[str, Any]] = None,
+        isolation_required: Optional[bool] = None,
+        context_key: Optional[Tuple] = None
+    ) -> PlacementOption:
+        """
+        Simulate placement of a patient in a single unit.
+        
+        Args:
+            unit_data: Unit data with capacity info
+            patient_context: Patient information
+            risk_context: Risk assessment data
+            isolation_required: Precomputed patient isolation flag (read from
+                patient_context if not given)
+            context_key: Precomputed MCDAAnalyzer.criteria_context_key for
+                the patient and risk context
+        
+        Returns:
+            PlacementOption for the unit
+        """
+        if isolation_required is None:
+            isolation_required = bool(patient_context.get("isolation_required"))
+        
+        unit_name = unit_data.get("unit", "Unknown")
+        capacity_score = unit_data.get("capacity_score", 50)
+        occupancy = unit_data.get("current_occupancy", 0.7)
+        staff_ratio = unit_data.get("staff_ratio", 1.0)
+        
+        status, wait_estimate, constraints = _score_unit(
+            capacity_score,
+            occupancy,
+            staff_ratio,
+            bool(unit_data.get("predicted_availability")),
+            isolation_required and not unit_data.get("isolation_beds")
+        )
+        
+        # Calculate MCDA scores for this placement; unavailable units can
+        # never be recommended, so they are not scored
+        if status is PlacementStatus.UNAVAILABLE:
+            mcda_scores = None
+        else:
             capacity_context = {
                 "capacity_score": capacity_score,
-                "current_occupancy": unit_data.get("current_occupancy", 0.7),
-                "staff_ratio": unit_data.get("staff_ratio", 1.0)
+                "current_occupancy": occupancy,
+                "staff_ratio": staff_ratio
             }
             
             mcda_scores = self.mcda_analyzer.calculate_from_context(
                 patient_context=patient_context,
                 capacity_context=capacity_context,
-                risk_context=risk_context
-            )
-            
-            # Determine status
-            if capacity_score >= 50:
-                status = PlacementStatus.AVAILABLE
-                wait_estimate = 0
-            elif capacity_score >= 30:
-                status = PlacementStatus.CONSTRAINED
-                wait_estimate = 15
-            elif unit_data.get("predicted_availability"):
-                status = PlacementStatus.PENDING
-                wait_estimate = 30
-            else:
-                status = PlacementStatus.UNAVAILABLE
-                wait_estimate = 60
-            
-            # Check for constraints
-            constraints = []
-            if unit_data.get("current_occupancy", 0) > 0.9:
-                constraints.append("High occupancy")
-            if unit_data.get("staff_ratio", 0) > 5:
-                constraints.append("Low staffing")
-            if patient_context.get("isolation_required") and not unit_data.get("isolation_beds"):
-                constraints.append("No isolation beds available")
-            
-            option = PlacementOption(
-                option_id=f"place_{unit_name.lower()}",
-                unit=unit_name,
-                status=status,
-                mcda_scores=mcda_scores,
-                capacity_score=capacity_score,
-                staff_ratio=unit_data.get("staff_ratio", 1.0),
-                estimated_wait_minutes=wait_estimate,
-                constraints=constraints
+                risk_context=risk_context,
+                context_key=context_key
             )
-            
-            options.append(option)
-        
-        # Sort by viability score
-        options.sort(key=lambda x: x.composite_viability_score, reverse=True)
         
-        return options
+        return PlacementOption(
+            option_id=f"place_{unit_name.lower()}",
+            unit=unit_name,
+            status=status,
+            mcda_scores=mcda_scores,
+            capacity_score=capacity_score,
+            staff_ratio=staff_ratio,
+            estimated_wait_minutes=wait_estimate,
+            constraints=constraints
+        )
     
     def run_timing_analysis(
         self,
         patient_context: Dict[str, Any],
         capacity_context: Dict[str, Any],
-        wait_times: Optional[List[int]] = None
+        wait_times: Optional[Sequence[int]] = None
     ) -> List[ScenarioOutcome]:
         """
         Run analysis for multiple wait time scenarios.
@@ -231,17 +427,12 @@ class ScenarioSimulator:
         else:
             trend = "stable"
         
-        scenarios = []
-        for wait in wait_times:
-            scenario = self.simulate_wait_scenario(
-                current_capacity_score=current_score,
-                patient_context=patient_context,
-                wait_minutes=wait,
-                capacity_trend=trend
-            )
-            scenarios.append(scenario)
-        
-        return scenarios
+        return self._simulate_wait_batch(
+            current_capacity_score=current_score,
+            patient_context=patient_context,
+            wait_times=wait_times,
+            capacity_trend=trend
+        )
 
 
 class ScenarioComparator:
@@ -307,9 +498,10 @@ class ScenarioComparator:
                 "No viable options currently. Consider waiting for capacity."
             )
         
-        # Best is highest viability score
-        best = max(viable, key=lambda x: x.composite_viability_score)
-        alternatives = [opt for opt in viable if opt != best][:3]
+        # Best is highest viability score, followed by up to 3 alternatives
+        best, *alternatives = heapq.nlargest(
+            4, viable, key=lambda x: x.composite_viability_score
+        )
         
         explanation = (
             f"Recommend placement in {best.unit} "
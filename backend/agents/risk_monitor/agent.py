@@ -2,10 +2,11 @@
 Risk Monitor Agent - Continuously assesses patient risk and tracks deterioration.
 Main agent implementation for Phase 2.
 """
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from backend.models.patient import Patient
 from backend.agents.risk_monitor.models import (
+    VITAL_COLUMNS,
     RiskAssessment,
     RiskFactorBreakdown,
     PatientRiskHistory,
@@ -19,6 +20,19 @@ from backend.agents.risk_monitor.calculators import (
 )
 
 
+# Critical thresholds for TrendCalculator.analyze_vital_trend
+CRITICAL_THRESHOLDS = {
+    "spo2": {"min": 88},
+    "heart_rate": {"min": 40, "max": 150},
+    "systolic_bp": {"min": 80, "max": 200},
+    "respiratory_rate": {"min": 8, "max": 35},
+    "temperature": {"min": 35, "max": 40}
+}
+
+# Per-vital edge tuples passed to TrendCalculator.analyze_vital_trend
+TREND_EDGES = TrendCalculator.resolve_edges(CRITICAL_THRESHOLDS)
+
+
 class RiskMonitorAgent:
     """
     Risk Monitor Agent - Tracks patient conditions and calculates risk scores.
@@ -33,32 +47,41 @@ class RiskMonitorAgent:
     def __init__(self):
         """Initialize Risk Monitor Agent"""
         self.patient_histories: Dict[str, PatientRiskHistory] = {}
+        # Patients whose latest assessment is high risk / deteriorating
+        self._high_risk: Set[str] = set()
+        self._deteriorating: Set[str] = set()
         self.vital_calculator = VitalScoreCalculator()
         self.trend_calculator = TrendCalculator()
         self.risk_calculator = RiskScoreCalculator()
     
-    def assess_patient(self, patient: Patient) -> RiskAssessment:
+    def assess_patient(self, patient: Patient, now: Optional[datetime] = None) -> RiskAssessment:
         """
         Perform complete risk assessment for a patient.
         
         Args:
             patient: Patient object with current vitals and history
+            now: Current time for time-since-admission (defaults to
+                datetime.now(); pass one value to share a clock read across
+                many assessments)
         
         Returns:
             RiskAssessment with score, trends, and recommendations
         """
+        if now is None:
+            now = datetime.now()
+        
         # Get or create patient history
-        if patient.id not in self.patient_histories:
-            self.patient_histories[patient.id] = PatientRiskHistory(patient_id=patient.id)
+        history = self.patient_histories.get(patient.id)
+        if history is None:
+            history = self.patient_histories[patient.id] = PatientRiskHistory(patient_id=patient.id)
         
-        history = self.patient_histories[patient.id]
         previous_assessment = history.latest_assessment
         
         # Calculate vital signs score (0-40 points)
         vital_score = self.vital_calculator.calculate_vital_score(patient.vitals)
         
         # Analyze vital trends
-        vital_trends = self._analyze_vital_trends(patient, previous_assessment)
+        vital_trends = self._analyze_vital_trends(patient, history.latest_vitals)
         
         # Calculate deterioration score (0-30 points)
         deterioration_score = self.trend_calculator.calculate_deterioration_score(vital_trends)
@@ -90,23 +113,23 @@ class RiskMonitorAgent:
         # Determine overall trend
         trend = self.risk_calculator.determine_overall_trend(vital_trends, risk_delta)
         
-        # Check if escalation needed
-        needs_escalation, escalation_reason = self.risk_calculator.should_escalate(
-            risk_score, trend, vital_trends
-        )
-        
         # Get critical vitals list
         critical_vitals = [
             name for name, vital_trend in vital_trends.items() 
             if vital_trend.critical
         ]
         
+        # Check if escalation needed
+        needs_escalation, escalation_reason = self.risk_calculator.should_escalate(
+            risk_score, trend, vital_trends, critical_vitals
+        )
+        
         # Recommend monitoring frequency
         monitoring_freq = self.risk_calculator.recommend_monitoring_frequency(risk_level, trend)
         
         # Calculate time since admission
         minutes_since_admission = int(
-            (datetime.now() - patient.admission_time).total_seconds() / 60
+            (now - patient.admission_time).total_seconds() / 60
         ) if patient.admission_time else None
         
         # Create risk assessment
@@ -128,13 +151,33 @@ class RiskMonitorAgent:
         
         # Store in history
         history.add_assessment(assessment)
+        (self._high_risk.add if assessment.is_high_risk else self._high_risk.discard)(patient.id)
+        (self._deteriorating.add if assessment.is_deteriorating else self._deteriorating.discard)(patient.id)
         
         return assessment
     
+    def assess_patients_batch(self, patients: List[Patient]) -> List[RiskAssessment]:
+        """
+        Assess a batch of patients (e.g. a full census refresh).
+        
+        Equivalent to calling assess_patient for each patient in order, but
+        the clock is read once, so every assessment in the batch measures
+        time since admission from the same instant.
+        
+        Args:
+            patients: Patients to assess
+        
+        Returns:
+            RiskAssessments in the same order as patients
+        """
+        now = datetime.now()
+        assess = self.assess_patient
+        return [assess(patient, now) for patient in patients]
+    
     def _analyze_vital_trends(
         self,
         patient: Patient,
-        previous_assessment: Optional[RiskAssessment]
+        previous_vitals: Tuple[Optional[float], ...]
     ) -> Dict[str, any]:
         """Analyze trends for all vital signs"""
         from backend.agents.risk_monitor.models import VitalTrend
@@ -142,59 +185,19 @@ class RiskMonitorAgent:
         current_vitals = patient.vitals
         trends = {}
         
-        # Get previous vital values if available
-        previous_vitals = {}
-        if previous_assessment and previous_assessment.vital_trends:
-            previous_vitals = {
-                name: trend.current_value 
-                for name, trend in previous_assessment.vital_trends.items()
-            }
-        
-        # Critical thresholds
-        thresholds = {
-            "spo2": {"min": 88},
-            "heart_rate": {"min": 40, "max": 150},
-            "systolic_bp": {"min": 80, "max": 200},
-            "respiratory_rate": {"min": 8, "max": 35},
-            "temperature": {"min": 35, "max": 40}
-        }
-        
-        # Analyze each vital
-        trends["spo2"] = self.trend_calculator.analyze_vital_trend(
+        current_values = (
             current_vitals.spo2,
-            previous_vitals.get("spo2"),
-            "spo2",
-            thresholds
-        )
-        
-        trends["heart_rate"] = self.trend_calculator.analyze_vital_trend(
             current_vitals.heart_rate,
-            previous_vitals.get("heart_rate"),
-            "heart_rate",
-            thresholds
-        )
-        
-        trends["systolic_bp"] = self.trend_calculator.analyze_vital_trend(
             current_vitals.systolic_bp,
-            previous_vitals.get("systolic_bp"),
-            "systolic_bp",
-            thresholds
+            current_vitals.respiratory_rate,
+            current_vitals.temperature
         )
         
-        if current_vitals.respiratory_rate is not None:
-            trends["respiratory_rate"] = self.trend_calculator.analyze_vital_trend(
-                current_vitals.respiratory_rate,
-                previous_vitals.get("respiratory_rate"),
-                "respiratory_rate",
-                thresholds
-            )
-        
-        trends["temperature"] = self.trend_calculator.analyze_vital_trend(
-            current_vitals.temperature,
-            previous_vitals.get("temperature"),
-            "temperature",
-            thresholds
-        )
+        # Analyze each vital (respiratory rate is optional)
+        analyze = self.trend_calculator.analyze_vital_trend
+        for name, current, previous in zip(VITAL_COLUMNS, current_values, previous_vitals):
+            if current is not None:
+                trends[name] = analyze(current, previous, name, TREND_EDGES[name])
         
         return trends
     
@@ -204,22 +207,14 @@ class RiskMonitorAgent:
     
     def get_high_risk_patients(self) -> list[str]:
         """Get list of patient IDs with high risk"""
-        high_risk = []
-        for patient_id, history in self.patient_histories.items():
-            latest = history.latest_assessment
-            if latest and latest.is_high_risk:
-                high_risk.append(patient_id)
-        return high_risk
+        return list(self._high_risk)
     
     def get_deteriorating_patients(self) -> list[str]:
         """Get list of patient IDs that are deteriorating"""
-        deteriorating = []
-        for patient_id, history in self.patient_histories.items():
-            latest = history.latest_assessment
-            if latest and latest.is_deteriorating:
-                deteriorating.append(patient_id)
-        return deteriorating
+        return list(self._deteriorating)
     
     def reset_history(self):
         """Clear all patient histories (for testing)"""
         self.patient_histories.clear()
+        self._high_risk.clear()
+        self._deteriorating.clear()
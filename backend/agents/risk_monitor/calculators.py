@@ -2,7 +2,9 @@
 Risk calculation algorithms for patient risk scoring.
 Implements clinical decision rules and trend analysis.
 """
-from typing import List, Optional, Dict
+from bisect import bisect_right
+from math import inf, nextafter
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 from backend.models.patient import Patient, VitalSigns, AcuityLevel
 from backend.agents.risk_monitor.models import (
@@ -13,6 +15,79 @@ from backend.agents.risk_monitor.models import (
 )
 
 
+def _upto(bound: float) -> float:
+    """Bucket edge for an inclusive upper bound: x <= bound sorts below it."""
+    return nextafter(bound, inf)
+
+
+def _weighted_terms(points: tuple, weight: float) -> tuple:
+    """Each bucket's points as its normalized term of the weighted vital sum."""
+    return tuple(p * weight / 12.0 for p in points)
+
+
+# NEWS2 point buckets for bisect_right: a value scores POINTS[i] where i is
+# the number of EDGES at or below it. Values falling between the clinical
+# ranges (e.g. a heart rate of 50.5) score as out of range.
+_SPO2_EDGES = (85, 88, 90, 92, 94, 96)
+_SPO2_POINTS = (12, 9, 6, 3, 2, 1, 0)
+
+_HR_EDGES = (_upto(40), 41, _upto(50), 51, _upto(90), 91, _upto(110), 111, _upto(130), 131, _upto(150))
+_HR_POINTS = (6, 12, 1, 12, 0, 12, 1, 12, 2, 12, 6, 12)
+
+_SBP_EDGES = (81, _upto(90), 91, _upto(100), 101, _upto(110), 111, _upto(219))
+_SBP_POINTS = (12, 6, 12, 2, 12, 1, 12, 0, 12)
+
+_RR_EDGES = (_upto(8), 9, _upto(11), 12, _upto(20), 21, _upto(24), 25, _upto(29), 30, _upto(35))
+_RR_POINTS = (2, 12, 1, 12, 0, 12, 1, 12, 2, 12, 6, 12)
+
+_TEMP_EDGES = (35.1, _upto(36.0), 36.1, _upto(38.0), 38.1, _upto(39.0), 39.1, _upto(40.0))
+_TEMP_POINTS = (6, 1, 6, 0, 6, 1, 6, 2, 6)
+
+# Deterioration points by trend direction (improvement is rewarded)
+_DIRECTION_POINTS = {
+    TrendDirection.RAPID_DETERIORATION: 8.0,
+    TrendDirection.DETERIORATING: 4.0,
+    TrendDirection.IMPROVING: -2.0,
+}
+
+# Vitals where deviation from normal in either direction is bad
+_BIDIRECTIONAL_VITALS = frozenset({"heart_rate", "respiratory_rate"})
+
+# Risk level by score: a score at or above _RISK_LEVEL_EDGES[i] is at least _RISK_LEVELS[i + 1]
+_RISK_LEVEL_EDGES = (31, 61, 81)
+_RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MODERATE, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+# Vital signs monitoring interval (minutes) for every (risk level, trend) pair:
+# the level's interval, tightened to 5 on rapid deterioration and 10 on deterioration
+_LEVEL_MONITORING_MINUTES = {
+    RiskLevel.CRITICAL: 5,  # Continuous monitoring
+    RiskLevel.HIGH: 10,
+    RiskLevel.MODERATE: 15,
+    RiskLevel.LOW: 30
+}
+_TREND_MONITORING_CAP = {
+    TrendDirection.RAPID_DETERIORATION: 5,
+    TrendDirection.DETERIORATING: 10
+}
+_MONITORING_MINUTES = {
+    (level, trend): min(minutes, _TREND_MONITORING_CAP.get(trend, minutes))
+    for level, minutes in _LEVEL_MONITORING_MINUTES.items()
+    for trend in TrendDirection
+}
+
+# Acuity points (0-15) by ESI level
+_ACUITY_SCORES = {
+    AcuityLevel.RESUSCITATION: 15.0,
+    AcuityLevel.EMERGENT: 12.0,
+    AcuityLevel.URGENT: 8.0,
+    AcuityLevel.LESS_URGENT: 4.0,
+    AcuityLevel.NON_URGENT: 0.0
+}
+
+# Comorbidities that add a bonus point each on top of the count-based score
+_HIGH_RISK_CONDITIONS = frozenset({"CAD", "CHF", "COPD", "CKD", "Previous MI", "Stroke history"})
+
+
 class VitalScoreCalculator:
     """Calculate risk scores from vital signs"""
     
@@ -24,109 +99,114 @@ class VitalScoreCalculator:
         "respiratory_rate": 2.0,
         "temperature": 1.5
     }
+    # Per-bucket terms of the weighted sum (points * weight / 12), so scoring
+    # an assessment is five lookups and an add
+    _SPO2_TERMS = _weighted_terms(_SPO2_POINTS, VITAL_WEIGHTS["spo2"])
+    _HR_TERMS = _weighted_terms(_HR_POINTS, VITAL_WEIGHTS["heart_rate"])
+    _SBP_TERMS = _weighted_terms(_SBP_POINTS, VITAL_WEIGHTS["systolic_bp"])
+    _RR_TERMS = _weighted_terms(_RR_POINTS, VITAL_WEIGHTS["respiratory_rate"])
+    _TEMP_TERMS = _weighted_terms(_TEMP_POINTS, VITAL_WEIGHTS["temperature"])
     
     @staticmethod
     def score_spo2(spo2: float) -> float:
         """Score oxygen saturation (0-12 points)"""
-        if spo2 >= 96:
-            return 0
-        elif spo2 >= 94:
-            return 1
-        elif spo2 >= 92:
-            return 2
-        elif spo2 >= 90:
-            return 3
-        elif spo2 >= 88:
-            return 6
-        elif spo2 >= 85:
-            return 9
-        else:
-            return 12
+        return _SPO2_POINTS[bisect_right(_SPO2_EDGES, spo2)]
     
     @staticmethod
     def score_heart_rate(hr: float) -> float:
         """Score heart rate (0-12 points)"""
-        if 51 <= hr <= 90:
-            return 0
-        elif 41 <= hr <= 50 or 91 <= hr <= 110:
-            return 1
-        elif 111 <= hr <= 130:
-            return 2
-        elif hr <= 40 or 131 <= hr <= 150:
-            return 6
-        else:  # <40 or >150
-            return 12
+        return _HR_POINTS[bisect_right(_HR_EDGES, hr)]
     
     @staticmethod
     def score_systolic_bp(sys_bp: float) -> float:
         """Score systolic blood pressure (0-12 points)"""
-        if 111 <= sys_bp <= 219:
-            return 0
-        elif 101 <= sys_bp <= 110:
-            return 1
-        elif 91 <= sys_bp <= 100:
-            return 2
-        elif 81 <= sys_bp <= 90:
-            return 6
-        else:  # <=80 or >=220
-            return 12
+        return _SBP_POINTS[bisect_right(_SBP_EDGES, sys_bp)]
     
     @staticmethod
     def score_respiratory_rate(rr: Optional[float]) -> float:
         """Score respiratory rate (0-12 points)"""
         if rr is None:
             return 0
-        
-        if 12 <= rr <= 20:
-            return 0
-        elif 9 <= rr <= 11 or 21 <= rr <= 24:
-            return 1
-        elif rr <= 8 or 25 <= rr <= 29:
-            return 2
-        elif 30 <= rr <= 35:
-            return 6
-        else:  # <8 or >35
-            return 12
+        return _RR_POINTS[bisect_right(_RR_EDGES, rr)]
     
     @staticmethod
     def score_temperature(temp: float) -> float:
         """Score temperature (0-6 points)"""
-        if 36.1 <= temp <= 38.0:
-            return 0
-        elif 35.1 <= temp <= 36.0 or 38.1 <= temp <= 39.0:
-            return 1
-        elif 39.1 <= temp <= 40.0:
-            return 2
-        else:  # <=35 or >=40
-            return 6
+        return _TEMP_POINTS[bisect_right(_TEMP_EDGES, temp)]
     
     @staticmethod
     def calculate_vital_score(vitals: VitalSigns) -> float:
         """Calculate overall vital signs risk score (0-40 points)"""
-        scores = {
-            "spo2": VitalScoreCalculator.score_spo2(vitals.spo2),
-            "heart_rate": VitalScoreCalculator.score_heart_rate(vitals.heart_rate),
-            "systolic_bp": VitalScoreCalculator.score_systolic_bp(vitals.systolic_bp),
-            "respiratory_rate": VitalScoreCalculator.score_respiratory_rate(vitals.respiratory_rate),
-            "temperature": VitalScoreCalculator.score_temperature(vitals.temperature)
-        }
+        calc = VitalScoreCalculator
+        rr = vitals.respiratory_rate
         
-        # Weighted sum, normalized to 0-40
-        weighted_sum = sum(scores[k] * VitalScoreCalculator.VITAL_WEIGHTS[k] / 12.0 for k in scores)
+        # Weighted sum, normalized to 0-40 (terms in VITAL_WEIGHTS order);
+        # the score_* bucket lookups are inlined as this runs every assessment
+        weighted_sum = (
+            calc._SPO2_TERMS[bisect_right(_SPO2_EDGES, vitals.spo2)]
+            + calc._HR_TERMS[bisect_right(_HR_EDGES, vitals.heart_rate)]
+            + calc._SBP_TERMS[bisect_right(_SBP_EDGES, vitals.systolic_bp)]
+            + (calc._RR_TERMS[bisect_right(_RR_EDGES, rr)] if rr is not None else 0.0)
+            + calc._TEMP_TERMS[bisect_right(_TEMP_EDGES, vitals.temperature)]
+        )
         return min(40.0, weighted_sum * 3.33)  # Scale to max 40
 
 
 class TrendCalculator:
     """Analyze vital sign trends over time"""
     
+    # Out-of-range edges per vital as (low, high); values strictly outside are flagged
+    OUT_OF_RANGE_EDGES = {
+        "spo2": (92, inf),
+        "heart_rate": (50, 120),
+        "systolic_bp": (90, 180),
+        "respiratory_rate": (10, 25),
+        "temperature": (36, 38.5)
+    }
+    
+    # Critical edges per vital as (low, high); only SpO2 is configurable
+    CRITICAL_EDGES = {
+        "spo2": (88, inf),
+        "heart_rate": (40, 150),
+        "systolic_bp": (80, 200),
+        "respiratory_rate": (8, 35),
+        "temperature": (35, 40)
+    }
+    
+    @classmethod
+    def resolve_edges(
+        cls,
+        critical_thresholds: Dict[str, Dict[str, float]]
+    ) -> Dict[str, Tuple[float, float, float, float]]:
+        """
+        Flatten critical thresholds into per-vital edge tuples.
+        
+        Resolve once (e.g. at import or per simulation run) and pass each
+        vital's tuple to analyze_vital_trend.
+        
+        Returns:
+            Dict of vital name -> (critical_low, critical_high, out_low, out_high)
+        """
+        edges = {}
+        for name, (critical_low, critical_high) in cls.CRITICAL_EDGES.items():
+            if name == "spo2":
+                critical_low = critical_thresholds.get("spo2", {}).get("min", critical_low)
+            edges[name] = (critical_low, critical_high, *cls.OUT_OF_RANGE_EDGES[name])
+        return edges
+    
     @staticmethod
     def analyze_vital_trend(
         current: float,
         previous: Optional[float],
         vital_name: str,
-        critical_thresholds: Dict[str, Dict[str, float]]
+        edges: Tuple[float, float, float, float]
     ) -> VitalTrend:
-        """Analyze trend for a single vital sign"""
+        """
+        Analyze trend for a single vital sign.
+        
+        edges is the vital's (critical_low, critical_high, out_low, out_high)
+        tuple from resolve_edges.
+        """
         
         trend = VitalTrend(current_value=current, previous_value=previous)
         
@@ -146,11 +226,8 @@ class TrendCalculator:
                 trend.direction = TrendDirection.DETERIORATING
             elif change > 2:
                 trend.direction = TrendDirection.IMPROVING
-            
-            trend.critical = current < critical_thresholds.get("spo2", {}).get("min", 88)
-            trend.out_of_range = current < 92
         
-        elif vital_name in ["heart_rate", "respiratory_rate"]:
+        elif vital_name in _BIDIRECTIONAL_VITALS:
             # Deviation from normal in either direction is bad
             abs_change = abs(change)
             if abs_change > 20:
@@ -159,13 +236,6 @@ class TrendCalculator:
                 trend.direction = TrendDirection.DETERIORATING
             elif abs_change < 5 and 60 <= current <= 100:  # Assuming HR
                 trend.direction = TrendDirection.IMPROVING
-            
-            if vital_name == "heart_rate":
-                trend.critical = current < 40 or current > 150
-                trend.out_of_range = current < 50 or current > 120
-            else:  # respiratory_rate
-                trend.critical = current < 8 or current > 35
-                trend.out_of_range = current < 10 or current > 25
         
         elif vital_name == "systolic_bp":
             # Low BP is more concerning
@@ -175,9 +245,6 @@ class TrendCalculator:
                 trend.direction = TrendDirection.DETERIORATING
             elif change > 10 and current < 140:
                 trend.direction = TrendDirection.IMPROVING
-            
-            trend.critical = current < 80 or current > 200
-            trend.out_of_range = current < 90 or current > 180
         
         elif vital_name == "temperature":
             # High temp is concerning
@@ -187,9 +254,13 @@ class TrendCalculator:
                 trend.direction = TrendDirection.DETERIORATING if current > 37.5 else TrendDirection.STABLE
             elif 36.5 <= current <= 37.5:
                 trend.direction = TrendDirection.IMPROVING
-            
-            trend.critical = current < 35 or current > 40
-            trend.out_of_range = current < 36 or current > 38.5
+        
+        else:
+            return trend
+        
+        critical_low, critical_high, out_low, out_high = edges
+        trend.critical = current < critical_low or current > critical_high
+        trend.out_of_range = current < out_low or current > out_high
         
         return trend
     
@@ -197,8 +268,9 @@ class TrendCalculator:
     def calculate_deterioration_score(vital_trends: Dict[str, VitalTrend]) -> float:
         """Calculate deterioration score from trends (0-30 points)"""
         score = 0.0
+        direction_points = _DIRECTION_POINTS
         
-        for vital_name, trend in vital_trends.items():
+        for trend in vital_trends.values():
             # Points for critical values
             if trend.critical:
                 score += 10.0
@@ -206,12 +278,7 @@ class TrendCalculator:
                 score += 5.0
             
             # Points for deterioration direction
-            if trend.direction == TrendDirection.RAPID_DETERIORATION:
-                score += 8.0
-            elif trend.direction == TrendDirection.DETERIORATING:
-                score += 4.0
-            elif trend.direction == TrendDirection.IMPROVING:
-                score -= 2.0  # Reward improvement
+            score += direction_points.get(trend.direction, 0.0)
         
         return min(30.0, max(0.0, score))
 
@@ -222,10 +289,9 @@ class RiskScoreCalculator:
     @staticmethod
     def calculate_comorbidity_score(patient: Patient) -> float:
         """Calculate risk from comorbidities (0-15 points)"""
-        high_risk_conditions = ["CAD", "CHF", "COPD", "CKD", "Previous MI", "Stroke history"]
-        
-        num_comorbidities = len(patient.comorbidities)
-        high_risk_count = sum(1 for c in patient.comorbidities if c in high_risk_conditions)
+        comorbidities = patient.comorbidities
+        num_comorbidities = len(comorbidities)
+        high_risk_count = sum(map(_HIGH_RISK_CONDITIONS.__contains__, comorbidities))
         
         # Base score from count
         score = min(10.0, num_comorbidities * 2.0)
@@ -241,44 +307,30 @@ class RiskScoreCalculator:
     @staticmethod
     def calculate_acuity_score(acuity_level: AcuityLevel) -> float:
         """Calculate score from acuity level (0-15 points)"""
-        acuity_scores = {
-            AcuityLevel.RESUSCITATION: 15.0,
-            AcuityLevel.EMERGENT: 12.0,
-            AcuityLevel.URGENT: 8.0,
-            AcuityLevel.LESS_URGENT: 4.0,
-            AcuityLevel.NON_URGENT: 0.0
-        }
-        return acuity_scores.get(acuity_level, 8.0)
+        return _ACUITY_SCORES.get(acuity_level, 8.0)
     
     @staticmethod
     def determine_risk_level(score: float) -> RiskLevel:
         """Convert score to risk level"""
-        if score >= 81:
-            return RiskLevel.CRITICAL
-        elif score >= 61:
-            return RiskLevel.HIGH
-        elif score >= 31:
-            return RiskLevel.MODERATE
-        else:
-            return RiskLevel.LOW
+        return _RISK_LEVELS[bisect_right(_RISK_LEVEL_EDGES, score)]
     
     @staticmethod
     def determine_overall_trend(vital_trends: Dict[str, VitalTrend], risk_delta: float) -> TrendDirection:
         """Determine overall patient trend"""
-        deteriorating_count = sum(
-            1 for t in vital_trends.values() 
-            if t.direction in [TrendDirection.DETERIORATING, TrendDirection.RAPID_DETERIORATION]
-        )
-        
-        rapid_deteriorating = any(
-            t.direction == TrendDirection.RAPID_DETERIORATION 
-            for t in vital_trends.values()
-        )
-        
-        improving_count = sum(
-            1 for t in vital_trends.values()
-            if t.direction == TrendDirection.IMPROVING
-        )
+        # Tally directions in one pass over the vitals (VitalTrend coerces
+        # direction to the enum member, so identity checks are safe)
+        deteriorating_count = 0
+        rapid_deteriorating = False
+        improving_count = 0
+        for t in vital_trends.values():
+            direction = t.direction
+            if direction is TrendDirection.RAPID_DETERIORATION:
+                rapid_deteriorating = True
+                deteriorating_count += 1
+            elif direction is TrendDirection.DETERIORATING:
+                deteriorating_count += 1
+            elif direction is TrendDirection.IMPROVING:
+                improving_count += 1
         
         if rapid_deteriorating or deteriorating_count >= 3:
             return TrendDirection.RAPID_DETERIORATION
@@ -293,9 +345,15 @@ class RiskScoreCalculator:
     def should_escalate(
         risk_score: float,
         trend: TrendDirection,
-        vital_trends: Dict[str, VitalTrend]
+        vital_trends: Dict[str, VitalTrend],
+        critical_vitals: Optional[List[str]] = None
     ) -> tuple[bool, Optional[str]]:
-        """Determine if patient needs escalation"""
+        """
+        Determine if patient needs escalation.
+        
+        critical_vitals may be passed if the caller has already collected
+        the names of critical vitals from vital_trends.
+        """
         
         # Critical score
         if risk_score >= 85:
@@ -306,7 +364,8 @@ class RiskScoreCalculator:
             return True, "Rapid clinical deterioration detected"
         
         # Multiple critical vitals
-        critical_vitals = [name for name, t in vital_trends.items() if t.critical]
+        if critical_vitals is None:
+            critical_vitals = [name for name, t in vital_trends.items() if t.critical]
         if len(critical_vitals) >= 2:
             return True, f"Multiple critical vitals: {', '.join(critical_vitals)}"
         
@@ -319,11 +378,4 @@ class RiskScoreCalculator:
     @staticmethod
     def recommend_monitoring_frequency(risk_level: RiskLevel, trend: TrendDirection) -> int:
         """Recommend vital signs monitoring frequency in minutes"""
-        if risk_level == RiskLevel.CRITICAL or trend == TrendDirection.RAPID_DETERIORATION:
-            return 5  # Continuous monitoring
-        elif risk_level == RiskLevel.HIGH or trend == TrendDirection.DETERIORATING:
-            return 10
-        elif risk_level == RiskLevel.MODERATE:
-            return 15
-        else:
-            return 30
+        return _MONITORING_MINUTES[risk_level, trend]
@@ -2,10 +2,17 @@
 Risk Monitor Agent data models.
 Defines risk assessment outputs and trend tracking structures.
 """
+from collections import deque
 from enum import Enum
 from datetime import datetime
-from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
+from typing import Any, Deque, Optional, List, Dict, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer, field_validator
+
+# Assessments kept per patient in PatientRiskHistory
+MAX_ASSESSMENT_HISTORY = 50
+
+# Vital signs tracked per patient, in the order trends are reported
+VITAL_COLUMNS = ("spo2", "heart_rate", "systolic_bp", "respiratory_rate", "temperature")
 
 
 class TrendDirection(str, Enum):
@@ -24,6 +31,11 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"    # 81-100
 
 
+# Membership sets for RiskAssessment.is_high_risk / is_deteriorating
+_HIGH_RISK_LEVELS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+_DETERIORATING_TRENDS = frozenset({TrendDirection.DETERIORATING, TrendDirection.RAPID_DETERIORATION})
+
+
 class VitalTrend(BaseModel):
     """Trend analysis for a single vital sign"""
     current_value: float
@@ -83,12 +95,12 @@ class RiskAssessment(BaseModel):
     @property
     def is_high_risk(self) -> bool:
         """Check if patient is high risk"""
-        return self.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]
+        return self.risk_level in _HIGH_RISK_LEVELS
     
     @property
     def is_deteriorating(self) -> bool:
         """Check if patient is deteriorating"""
-        return self.trend in [TrendDirection.DETERIORATING, TrendDirection.RAPID_DETERIORATION]
+        return self.trend in _DETERIORATING_TRENDS
     
     def to_summary(self) -> Dict:
         """Convert to summary dict for display"""
@@ -106,20 +118,62 @@ class RiskAssessment(BaseModel):
 class PatientRiskHistory(BaseModel):
     """Historical risk assessments for trend analysis"""
     patient_id: str
-    assessments: List[RiskAssessment] = Field(default_factory=list, max_length=50)
+    # Ring buffer: appending beyond the limit drops the oldest assessment
+    assessments: Deque[RiskAssessment] = Field(
+        default_factory=lambda: deque(maxlen=MAX_ASSESSMENT_HISTORY)
+    )
+    
+    @field_validator("assessments")
+    @classmethod
+    def _bound_assessments(cls, assessments: Deque[RiskAssessment]) -> Deque[RiskAssessment]:
+        """Keep only the newest MAX_ASSESSMENT_HISTORY assessments of a validated history"""
+        return deque(assessments, maxlen=MAX_ASSESSMENT_HISTORY)
+    
+    @field_serializer("assessments")
+    def _serialize_assessments(self, assessments: Deque[RiskAssessment]) -> List[RiskAssessment]:
+        """Dump assessments as a list, as before the ring buffer"""
+        return list(assessments)
+    
+    # Latest vital readings in VITAL_COLUMNS order (None where not measured)
+    _latest_vitals: Tuple[Optional[float], ...] = PrivateAttr(
+        default=(None,) * len(VITAL_COLUMNS)
+    )
+    
+    # Risk scores of the retained assessments, oldest first (parallel to assessments)
+    _risk_scores: Deque[float] = PrivateAttr(
+        default_factory=lambda: deque(maxlen=MAX_ASSESSMENT_HISTORY)
+    )
+    
+    def model_post_init(self, __context: Any) -> None:
+        if self.assessments:
+            self._latest_vitals = self._vitals_row(self.assessments[-1])
+            self._risk_scores.extend(a.risk_score for a in self.assessments)
+    
+    @staticmethod
+    def _vitals_row(assessment: RiskAssessment) -> Tuple[Optional[float], ...]:
+        trends = assessment.vital_trends
+        return tuple(
+            trends[name].current_value if name in trends else None
+            for name in VITAL_COLUMNS
+        )
     
     def add_assessment(self, assessment: RiskAssessment):
         """Add new assessment and maintain history limit"""
         self.assessments.append(assessment)
-        if len(self.assessments) > 50:
-            self.assessments.pop(0)
+        self._latest_vitals = self._vitals_row(assessment)
+        self._risk_scores.append(assessment.risk_score)
     
     @property
     def latest_assessment(self) -> Optional[RiskAssessment]:
         """Get most recent assessment"""
         return self.assessments[-1] if self.assessments else None
     
+    @property
+    def latest_vitals(self) -> Tuple[Optional[float], ...]:
+        """Get latest vital readings, in VITAL_COLUMNS order"""
+        return self._latest_vitals
+    
     @property
     def risk_trajectory(self) -> List[float]:
         """Get risk score trajectory over time"""
-        return [a.risk_score for a in self.assessments]
+        return list(self._risk_scores)
@@ -5,6 +5,7 @@ Provides endpoints for monitoring AI agent status.
 """
 from fastapi import APIRouter
 from typing import Dict, Any, List
+from collections import defaultdict
 from datetime import datetime
 
 router = APIRouter()
@@ -50,6 +51,14 @@ DEFAULT_AGENTS = [
     }
 ]
 
+# DEFAULT_AGENTS by agent_name
+_AGENT_BY_NAME = {agent["agent_name"]: agent for agent in DEFAULT_AGENTS}
+
+# Last /status response, keyed on the decision history it was built from.
+# Decisions are only ever appended, so the list identity, its length and its
+# newest entry identify a snapshot; dashboards polling between decisions hit this.
+_status_cache: Dict[str, Any] = {"key": None, "value": None}
+
 
 @router.get("/status")
 async def get_agents_status() -> List[Dict[str, Any]]:
@@ -59,28 +68,43 @@ async def get_agents_status() -> List[Dict[str, Any]]:
     state_manager = get_state_manager()
     all_decisions = state_manager.get_decisions()
     
-    # Count decisions per agent
-    agent_decision_counts = {}
+    newest = all_decisions[-1] if all_decisions else None
+    cache_key = (
+        id(all_decisions),
+        len(all_decisions),
+        id(newest),
+        getattr(newest, 'timestamp', None)
+    )
+    if _status_cache["key"] == cache_key:
+        return _status_cache["value"]
+    
+    # Count decisions and track the latest timestamp per agent in one pass
+    agent_decision_counts = defaultdict(int)
     agent_last_decision_times = {}
+    last_time = agent_last_decision_times.get
     
     for decision in all_decisions:
         agent_name = getattr(decision, 'agent_name', 'Unknown')
-        agent_decision_counts[agent_name] = agent_decision_counts.get(agent_name, 0) + 1
+        agent_decision_counts[agent_name] += 1
         
-        # Track last decision time
-        if agent_name not in agent_last_decision_times or decision.timestamp > agent_last_decision_times[agent_name]:
-            agent_last_decision_times[agent_name] = decision.timestamp
+        timestamp = decision.timestamp
+        previous = last_time(agent_name)
+        if previous is None or timestamp > previous:
+            agent_last_decision_times[agent_name] = timestamp
     
-    # Update agent status with actual counts
-    agents_with_counts = []
-    for agent in DEFAULT_AGENTS:
-        agent_copy = agent.copy()
-        agent_name = agent["agent_name"]
-        agent_copy["decision_count"] = agent_decision_counts.get(agent_name, 0)
-        agent_copy["last_decision_time"] = agent_last_decision_times.get(agent_name)
-        agents_with_counts.append(agent_copy)
+    # Agent status with actual counts
+    statuses = [
+        {
+            **agent,
+            "decision_count": agent_decision_counts.get(agent_name, 0),
+            "last_decision_time": agent_last_decision_times.get(agent_name)
+        }
+        for agent_name, agent in _AGENT_BY_NAME.items()
+    ]
     
-    return agents_with_counts
+    _status_cache["key"] = cache_key
+    _status_cache["value"] = statuses
+    return statuses
 
 
 @router.get("/list")
@@ -95,7 +119,7 @@ async def list_agents():
 @router.get("/{agent_name}/status")
 async def get_agent_status(agent_name: str) -> Dict[str, Any]:
     """Get status of a specific agent."""
-    for agent in DEFAULT_AGENTS:
-        if agent["agent_name"] == agent_name:
-            return agent
-    return {"error": f"Agent {agent_name} not found"}
+    agent = _AGENT_BY_NAME.get(agent_name)
+    if agent is None:
+        return {"error": f"Agent {agent_name} not found"}
+    return agent
@@ -23,9 +23,8 @@ async def list_patients():
 async def get_patient(patient_id: str):
     """Get detailed patient information."""
     orchestrator = get_orchestrator()
-    patients = orchestrator.get_patients()
+    patient = orchestrator.get_patient(patient_id)
     
-    patient = next((p for p in patients if p["id"] == patient_id), None)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient not found")
     
@@ -36,9 +35,8 @@ async def get_patient(patient_id: str):
 async def get_patient_vitals(patient_id: str):
     """Get patient's current vital signs."""
     orchestrator = get_orchestrator()
-    patients = orchestrator.get_patients()
+    patient = orchestrator.get_patient(patient_id)
     
-    patient = next((p for p in patients if p["id"] == patient_id), None)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient not found")
     
@@ -5,7 +5,7 @@ WebSocket handler for real-time updates to frontend.
 import logging
 import asyncio
 import json
-from typing import List, Set
+from typing import Dict, List, Set
 from datetime import datetime
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
@@ -14,6 +14,7 @@ from pydantic import BaseModel
 from backend.core.event_bus import get_event_bus
 from backend.core.state_manager import get_state_manager
 from backend.models.events import EventType, AgentEvent, DecisionEvent
+from backend.utils.serialization import dumps_text
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +24,19 @@ router = APIRouter()
 class ConnectionManager:
     """
     Manages WebSocket connections and broadcasts.
+    
+    Messages to one client are sent in the order they were issued (each
+    connection has its own send lock); a client that does not accept a
+    message within SEND_TIMEOUT seconds is disconnected.
     """
     
+    SEND_TIMEOUT = 5.0  # seconds
+    
     def __init__(self):
         self.active_connections: List[WebSocket] = []
         self._lock = asyncio.Lock()
+        self._send_locks: Dict[WebSocket, asyncio.Lock] = {}
+        self._failed: Set[WebSocket] = set()  # Send failed; awaiting disconnect()
         self._subscribed_to_events = False
 
     async def connect(self, websocket: WebSocket) -> None:
@@ -47,35 +56,55 @@ class ConnectionManager:
         async with self._lock:
             if websocket in self.active_connections:
                 self.active_connections.remove(websocket)
+            self._send_locks.pop(websocket, None)
+            self._failed.discard(websocket)
         
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
+    async def _send(self, websocket: WebSocket, message_json: str) -> None:
+        """Send text to one client, in order and within SEND_TIMEOUT."""
+        lock = self._send_locks.get(websocket)
+        if lock is None:
+            lock = self._send_locks[websocket] = asyncio.Lock()
+        async with lock:
+            # Sends queued behind a failed one fail fast instead of each timing out
+            if websocket in self._failed:
+                raise ConnectionError("client already failed a send")
+            try:
+                await asyncio.wait_for(websocket.send_text(message_json), self.SEND_TIMEOUT)
+            except Exception:
+                self._failed.add(websocket)
+                raise
+
     async def broadcast(self, message: dict) -> None:
         """Broadcast a message to all connected clients."""
         if not self.active_connections:
             return
         
-        message_json = json.dumps(message, default=str)
+        # Serialized once and shared by every client
+        message_json = dumps_text(message, default=str)
         
-        disconnected = []
         async with self._lock:
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(message_json)
-                except Exception as e:
-                    logger.warning(f"Failed to send to client: {e}")
-                    disconnected.append(connection)
+            connections = list(self.active_connections)
+        
+        # Send to every client concurrently so one slow socket doesn't stall the rest
+        results = await asyncio.gather(
+            *(self._send(connection, message_json) for connection in connections),
+            return_exceptions=True
+        )
         
-        # Clean up disconnected clients
-        for conn in disconnected:
-            await self.disconnect(conn)
+        # Clean up disconnected (or stalled) clients
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to send to client: {result!r}")
+                await self.disconnect(connection)
 
     async def send_to_client(self, websocket: WebSocket, message: dict) -> None:
         """Send a message to a specific client."""
         try:
-            await websocket.send_text(json.dumps(message, default=str))
+            await self._send(websocket, dumps_text(message, default=str))
         except Exception as e:
-            logger.warning(f"Failed to send to client: {e}")
+            logger.warning(f"Failed to send to client: {e!r}")
             await self.disconnect(websocket)
 
     def _subscribe_to_events(self) -> None:
@@ -15,9 +15,11 @@ Flow Orchestrator's placement recommendations.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from enum import Enum
 
+from backend.utils.serialization import ReadOnlyDict
+
 
 class CriterionType(str, Enum):
     """The four main decision criteria."""
@@ -76,7 +78,7 @@ class MCDAWeights:
         return cls(safety=0.30, urgency=0.25, capacity=0.30, impact=0.15)
 
 
-@dataclass
+@dataclass(slots=True)
 class MCDAScores:
     """
     Container for MCDA scores - the primary output of the MCDA analysis.
@@ -97,8 +99,13 @@ class MCDAScores:
     weights_used: MCDAWeights = field(default_factory=MCDAWeights)
     timestamp: datetime = field(default_factory=datetime.now)
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    _dict_cache: Optional[ReadOnlyDict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> Mapping[str, Any]:
+        if self._dict_cache is not None:
+            return self._dict_cache
+        
+        self._dict_cache = ReadOnlyDict({
             "safety": round(self.safety, 2),
             "urgency": round(self.urgency, 2),
             "capacity": round(self.capacity, 2),
@@ -106,7 +113,8 @@ class MCDAScores:
             "composite_score": round(self.composite_score, 2),
             "weights_used": self.weights_used.to_dict(),
             "timestamp": self.timestamp.isoformat()
-        }
+        })
+        return self._dict_cache
     
     @property
     def priority_level(self) -> str:
@@ -159,8 +167,12 @@ class MCDAAnalyzer:
     and performs trade-off analysis between options.
     """
     
+    # Max number of memoized (safety, urgency, impact) criterion triples
+    CRITERIA_CACHE_SIZE = 1024
+    
     def __init__(self, weights: Optional[MCDAWeights] = None):
         self.weights = weights or MCDAWeights()
+        self._criteria_cache: Dict[Tuple, Tuple[float, float, float]] = {}
     
     def set_weights(self, weights: MCDAWeights) -> None:
         """Update the weighting configuration."""
@@ -203,15 +215,42 @@ class MCDAAnalyzer:
         self,
         patient_context: Dict[str, Any],
         capacity_context: Dict[str, Any],
-        risk_context: Optional[Dict[str, Any]] = None
+        risk_context: Optional[Dict[str, Any]] = None,
+        context_key: Optional[Tuple] = None
     ) -> MCDAScores:
         """
         Calculate MCDA scores from patient and capacity context.
+        
+        The context-derived criterion scores are memoized on exactly the
+        fields they read, so repeated placements for similar patients only
+        pay for the weighted composite. Callers scoring one patient against
+        many units can pass context_key (from criteria_context_key) to
+        avoid rebuilding the patient part of the key for every unit.
         """
-        safety_score = self._calculate_safety_score(patient_context, risk_context)
-        urgency_score = self._calculate_urgency_score(patient_context)
+        if context_key is None:
+            context_key = self.criteria_context_key(patient_context, risk_context)
+        if context_key is not None:
+            # Impact only depends on which occupancy band the unit is in
+            occupancy = capacity_context.get("current_occupancy", 0.7)
+            key = (context_key, 2 if occupancy > 0.9 else (1 if occupancy > 0.8 else 0))
+            criteria = self._criteria_cache.get(key)
+        else:
+            key = criteria = None
+        
+        if criteria is None:
+            criteria = (
+                self._calculate_safety_score(patient_context, risk_context),
+                self._calculate_urgency_score(patient_context),
+                self._calculate_impact_score(patient_context, capacity_context)
+            )
+            if key is not None:
+                if len(self._criteria_cache) >= self.CRITERIA_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del self._criteria_cache[next(iter(self._criteria_cache))]
+                self._criteria_cache[key] = criteria
+        
+        safety_score, urgency_score, impact_score = criteria
         capacity_score = capacity_context.get("capacity_score", 50)
-        impact_score = self._calculate_impact_score(patient_context, capacity_context)
         
         return self.calculate_scores(
             safety_score=safety_score,
@@ -220,6 +259,43 @@ class MCDAAnalyzer:
             impact_score=impact_score
         )
     
+    @staticmethod
+    def criteria_context_key(
+        patient_context: Dict[str, Any],
+        risk_context: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple]:
+        """
+        Build the patient/risk part of the criterion cache key.
+        
+        Covers every input of the safety, urgency and impact scores except
+        unit occupancy. Flags are reduced to their truthiness, as the
+        scorers only test them. Returns None if a value is unhashable.
+        """
+        if risk_context:
+            safety_inputs = (
+                True,
+                risk_context.get("risk_score", 50),
+                risk_context.get("trajectory", "stable")
+            )
+        else:
+            safety_inputs = (False, patient_context.get("acuity_level", 3))
+        key = (
+            safety_inputs,
+            bool(patient_context.get("requires_monitoring", False)),
+            bool(patient_context.get("isolation_required", False)),
+            patient_context.get("wait_time_minutes", 0),
+            bool(patient_context.get("is_emergency", False)),
+            bool(patient_context.get("needs_surgery", False)),
+            bool(patient_context.get("time_critical_condition", False)),
+            bool(patient_context.get("boarding_in_ed", False)),
+            bool(patient_context.get("pending_procedures", []))
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
     def _calculate_safety_score(
         self,
         patient_context: Dict[str, Any],
@@ -184,43 +184,52 @@ class SimulationOrchestrator:
     
     def get_patients(self) -> List[Dict[str, Any]]:
         """Get all active patients with their latest risk assessments."""
-        patients_with_risk = []
+        histories = self.risk_monitor.patient_histories
+        summarize = self._patient_summary
+        return [summarize(patient, histories.get(patient.id)) for patient in self.patients.values()]
+    
+    def get_patient(self, patient_id: str) -> Optional[Dict[str, Any]]:
+        """Get one active patient with their latest risk assessment."""
+        patient = self.patients.get(patient_id)
+        if patient is None:
+            return None
+        return self._patient_summary(patient, self.risk_monitor.get_patient_history(patient_id))
+    
+    @staticmethod
+    def _patient_summary(patient, history) -> Dict[str, Any]:
+        """Build the API view of a patient from its latest risk history entry."""
+        latest_risk = history.latest_assessment if history else None
+        vitals = patient.vitals
+        
+        patient_dict = {
+            "id": patient.id,
+            "age": patient.age,
+            "gender": patient.gender,
+            "acuity_level": patient.acuity_level,
+            "chief_complaint": patient.chief_complaint,
+            "comorbidities": patient.comorbidities,
+            "vitals": {
+                "heart_rate": vitals.heart_rate,
+                "systolic_bp": vitals.systolic_bp,
+                "diastolic_bp": vitals.diastolic_bp,
+                "spo2": vitals.spo2,
+                "respiratory_rate": vitals.respiratory_rate,
+                "temperature": vitals.temperature
+            },
+            "admission_time": patient.admission_time.isoformat() if patient.admission_time else None
+        }
         
-        for patient in self.patients.values():
-            history = self.risk_monitor.get_patient_history(patient.id)
-            latest_risk = history.latest_assessment if history else None
-            
-            patient_dict = {
-                "id": patient.id,
-                "age": patient.age,
-                "gender": patient.gender,
-                "acuity_level": patient.acuity_level,
-                "chief_complaint": patient.chief_complaint,
-                "comorbidities": patient.comorbidities,
-                "vitals": {
-                    "heart_rate": patient.vitals.heart_rate,
-                    "systolic_bp": patient.vitals.systolic_bp,
-                    "diastolic_bp": patient.vitals.diastolic_bp,
-                    "spo2": patient.vitals.spo2,
-                    "respiratory_rate": patient.vitals.respiratory_rate,
-                    "temperature": patient.vitals.temperature
-                },
-                "admission_time": patient.admission_time.isoformat() if patient.admission_time else None
+        if latest_risk:
+            patient_dict["risk"] = {
+                "score": latest_risk.risk_score,
+                "level": latest_risk.risk_level.value,
+                "trend": latest_risk.trend.value,
+                "needs_escalation": latest_risk.needs_escalation,
+                "critical_vitals": latest_risk.critical_vitals,
+                "monitoring_frequency": latest_risk.recommended_monitoring_frequency
             }
-            
-            if latest_risk:
-                patient_dict["risk"] = {
-                    "score": latest_risk.risk_score,
-                    "level": latest_risk.risk_level.value,
-                    "trend": latest_risk.trend.value,
-                    "needs_escalation": latest_risk.needs_escalation,
-                    "critical_vitals": latest_risk.critical_vitals,
-                    "monitoring_frequency": latest_risk.recommended_monitoring_frequency
-                }
-            
-            patients_with_risk.append(patient_dict)
         
-        return patients_with_risk
+        return patient_dict
     
     def get_patient_risk(self, patient_id: str) -> Optional[Dict[str, Any]]:
         """Get risk assessment for specific patient."""
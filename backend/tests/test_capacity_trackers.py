@@ -0,0 +1,195 @@
+"""
+Tests for Capacity Intelligence trackers
+
+Verifies:
+1. StaffTracker least-loaded index - stays correct as workloads change and after pickling
+2. StaffTracker bulk registration and availability queries
+3. CapacityTrackingSystem assessment cache - invalidated by bed changes
+
+Run: python -m pytest backend/tests/test_capacity_trackers.py
+"""
+
+import sys
+import os
+import pickle
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.agents.capacity_intelligence.models import BedState, StaffWorkload, UnitType
+from backend.agents.capacity_intelligence.trackers import CapacityTrackingSystem, StaffTracker
+
+
+def _nurse(staff_id: str, unit: UnitType = UnitType.ICU, count: int = 0) -> StaffWorkload:
+    return StaffWorkload(
+        staff_id=staff_id,
+        name=f"Nurse {staff_id}",
+        role="nurse",
+        unit=unit,
+        current_patient_count=count,
+        max_patient_capacity=4
+    )
+
+
+def _least_loaded_by_scan(tracker: StaffTracker, unit: UnitType) -> StaffWorkload:
+    return min(tracker.get_unit_staff(unit), key=lambda s: s.workload_ratio)
+
+
+def test_least_loaded_after_workload_update():
+    """update_workload re-ranks the staff member and invalidates caches."""
+    tracker = StaffTracker()
+    a, b = _nurse("A", count=2), _nurse("B", count=1)
+    tracker.register_staff(a)
+    tracker.register_staff(b)
+    assert tracker.get_least_loaded_staff(UnitType.ICU) is b
+
+    revision = tracker.revision
+    assert tracker.update_workload("B", current_patient_count=4)
+    assert tracker.revision > revision, "Count change should invalidate caches"
+    assert tracker.get_least_loaded_staff(UnitType.ICU) is a
+
+    tracker.update_workload("A", current_patient_count=4)
+    tracker.update_workload("B", max_patient_capacity=8)
+    assert tracker.get_least_loaded_staff(UnitType.ICU) is b
+    assert not tracker.update_workload("Z", current_patient_count=1)
+
+
+def test_least_loaded_after_assign_and_unassign():
+    """The heap agrees with a min() scan through assignments and releases."""
+    tracker = StaffTracker()
+    for i in range(4):
+        tracker.register_staff(_nurse(f"N{i}", count=0))
+
+    steps = [
+        ("assign", "N0", "p1"), ("assign", "N1", "p2"), ("assign", "N0", "p3"),
+        ("assign", "N2", "p4"), ("assign", "N3", "p5"), ("unassign", "N0", "p1"),
+        ("unassign", "N3", "p5"), ("assign", "N3", "p6"), ("unassign", "N9", "p1"),
+    ]
+    for action, staff_id, patient_id in steps:
+        getattr(tracker, f"{action}_patient")(staff_id, patient_id)
+        expected = _least_loaded_by_scan(tracker, UnitType.ICU)
+        assert tracker.get_least_loaded_staff(UnitType.ICU) is expected, (action, staff_id)
+
+
+def test_least_loaded_ignores_replaced_and_moved_staff():
+    """Re-registering an id (same or different unit) supersedes the old entry."""
+    tracker = StaffTracker()
+    old = _nurse("A", count=0)
+    tracker.register_staff(old)
+    tracker.register_staff(_nurse("B", count=2))
+
+    moved = _nurse("A", unit=UnitType.WARD, count=0)
+    tracker.register_staff(moved)
+    assert tracker.get_least_loaded_staff(UnitType.ICU).staff_id == "B"
+    assert tracker.get_least_loaded_staff(UnitType.WARD) is moved
+
+    # Updates by id reach the registered object, not the replaced one
+    tracker.update_workload("A", current_patient_count=3)
+    assert moved.current_patient_count == 3 and old.current_patient_count == 0
+    assert tracker.get_least_loaded_staff(UnitType.ICU).staff_id == "B"
+    assert tracker.get_least_loaded_staff(UnitType.ED) is None
+
+
+def test_least_loaded_after_pickle_round_trip():
+    """A pickled tracker keeps a working least-loaded index."""
+    system = CapacityTrackingSystem()
+    system.initialize_demo_data()
+    copy = pickle.loads(pickle.dumps(system, pickle.HIGHEST_PROTOCOL))
+    tracker = copy.staff_tracker
+
+    for unit in tracker.tracked_units():
+        assert tracker.get_least_loaded_staff(unit) is _least_loaded_by_scan(tracker, unit)
+
+    least = tracker.get_least_loaded_staff(UnitType.ICU)
+    for i in range(3):
+        tracker.assign_patient(least.staff_id, f"P-X{i}")
+    assert tracker.get_least_loaded_staff(UnitType.ICU) is _least_loaded_by_scan(tracker, UnitType.ICU)
+    assert tracker.get_least_loaded_staff(UnitType.ICU) is not least
+
+    # The original is unaffected by changes to the copy
+    original = system.staff_tracker.get_staff(least.staff_id)
+    assert original is not least and original.assigned_patients == []
+    assert system.staff_tracker.get_least_loaded_staff(UnitType.ICU).staff_id == least.staff_id
+
+
+def _staff_batch():
+    counts = [(UnitType.ICU, 2), (UnitType.WARD, 4), (UnitType.ICU, 0), (UnitType.ED, 3), (UnitType.ICU, 0)]
+    return [_nurse(f"S{i}", unit=unit, count=count) for i, (unit, count) in enumerate(counts)]
+
+
+def _tracker_state(tracker: StaffTracker):
+    return {
+        unit: (
+            [s.staff_id for s in tracker.get_unit_staff(unit)],
+            tracker.get_unit_staff_metrics(unit),
+            getattr(tracker.get_least_loaded_staff(unit), "staff_id", None),
+        )
+        for unit in UnitType
+    }
+
+
+def test_bulk_register_matches_one_by_one():
+    """bulk_register leaves the tracker as registering each member in turn would."""
+    one_by_one, bulk = StaffTracker(), StaffTracker()
+    for staff in _staff_batch():
+        one_by_one.register_staff(staff)
+    bulk.bulk_register(_staff_batch())
+    assert _tracker_state(bulk) == _tracker_state(one_by_one)
+    assert sorted(bulk.tracked_units(), key=lambda u: u.value) == sorted(one_by_one.tracked_units(), key=lambda u: u.value)
+
+    # Re-registering known ids and repeats within a batch
+    batch = [_nurse("S0", unit=UnitType.WARD, count=1), _nurse("S9", count=3), _nurse("S9", count=1)]
+    for staff in batch:
+        one_by_one.register_staff(staff)
+    bulk.bulk_register([_nurse("S0", unit=UnitType.WARD, count=1), _nurse("S9", count=3), _nurse("S9", count=1)])
+    assert _tracker_state(bulk) == _tracker_state(one_by_one)
+
+    # Bulk-registered staff keep the heap current on later assignments
+    bulk.assign_patient("S2", "p1")
+    bulk.assign_patient("S2", "p2")
+    assert bulk.get_least_loaded_staff(UnitType.ICU) is _least_loaded_by_scan(bulk, UnitType.ICU)
+
+
+def test_available_staff_queries():
+    """has_available_staff and find_available_staff(limit=) agree with a scan."""
+    tracker = StaffTracker()
+    tracker.bulk_register([_nurse(f"N{i}", count=count) for i, count in enumerate([4, 1, 3, 0, 2])])
+
+    for min_capacity in range(6):
+        expected = [s for s in tracker.get_unit_staff(UnitType.ICU) if s.available_capacity >= min_capacity]
+        assert tracker.find_available_staff(UnitType.ICU, min_capacity) == expected
+        assert tracker.has_available_staff(UnitType.ICU, min_capacity) == bool(expected)
+        for limit in range(4):
+            assert tracker.find_available_staff(UnitType.ICU, min_capacity, limit=limit) == expected[:limit]
+
+    assert [s.staff_id for s in tracker.find_available_staff(UnitType.ICU, 2, limit=2)] == ["N1", "N3"]
+    assert tracker.find_available_staff(UnitType.ICU, limit=-1) == []
+    assert tracker.find_available_staff(UnitType.OR) == []
+    assert not tracker.has_available_staff(UnitType.OR)
+
+    tracker.assign_patient("N3", "p1")
+    tracker.assign_patient("N3", "p2")
+    tracker.assign_patient("N3", "p3")
+    assert not tracker.has_available_staff(UnitType.ICU, 4)
+
+
+def test_assessment_refreshes_after_bed_change():
+    """A cached unit assessment is rebuilt once one of the unit's beds changes state."""
+    system = CapacityTrackingSystem()
+    system.initialize_demo_data()
+    system.ASSESSMENT_MAX_AGE = 60  # Only revision changes should rebuild here
+    icu = system.get_unit_assessment(UnitType.ICU)
+    ward = system.get_unit_assessment(UnitType.WARD)
+    assert system.get_unit_assessment(UnitType.ICU) is icu, "Unchanged unit should be served from cache"
+
+    revision = system.revision
+    bed = system.bed_tracker.get_available_beds(UnitType.ICU)[0]
+    system.bed_tracker.update_bed_state(bed.bed_id, BedState.OCCUPIED, "P-NEW")
+    assert system.revision > revision
+
+    refreshed = system.get_unit_assessment(UnitType.ICU)
+    assert refreshed is not icu
+    assert refreshed.available_bed_count == icu.available_bed_count - 1
+    assert refreshed.current_occupancy > icu.current_occupancy
+    assert system.get_unit_assessment(UnitType.WARD) is ward, "Other units keep their cached assessment"
@@ -0,0 +1,167 @@
+"""
+Tests for Flow Orchestrator scenario simulation and recommendations
+
+Verifies:
+1. ScenarioSimulator.apply_policy - default tables, overrides, rejected policies
+2. FlowRecommendation.to_json_bytes - same document as to_dict()
+3. Cached to_dict() results - read-only, so callers cannot corrupt them
+
+Run: python -m pytest backend/tests/test_flow_scenarios.py
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.agents.flow_orchestrator.models import FlowRecommendation
+from backend.agents.flow_orchestrator.scenarios import ScenarioSimulator
+from backend.reasoning.decision_engine import ActionType
+from backend.utils import serialization
+
+
+PATIENT = {"acuity_level": 3, "risk_score": 55}
+
+
+def _outcomes(simulator: ScenarioSimulator, capacity: float = 40, trend: str = "stable"):
+    return [
+        simulator.simulate_wait_scenario(capacity, PATIENT, wait, trend).to_dict()
+        for wait in ScenarioSimulator.DEFAULT_WAIT_TIMES
+    ]
+
+
+def test_default_policy_matches_built_in_tables():
+    """Applying the documented defaults explicitly changes nothing."""
+    simulator = ScenarioSimulator()
+    expected = {trend: _outcomes(simulator, trend=trend) for trend in ("improving", "stable", "declining")}
+
+    simulator.apply_policy({
+        "trend_rates": {"improving": (0.5, 0.7), "declining": (-0.3, 0.3), "stable": (0.15, 0.5)},
+        "wait_risk_thresholds": (15, 30, 60),
+        "bed_wait_thresholds": (30, 50, 70),
+        "bed_wait_minutes": (45, 20, 10, 0),
+    })
+    assert {trend: _outcomes(simulator, trend=trend) for trend in expected} == expected
+
+    # An empty policy is a no-op as well
+    simulator.apply_policy({})
+    assert _outcomes(simulator) == expected["stable"]
+
+
+def test_policy_override_changes_outcomes():
+    """Overrides reach the simulation and stay local to the simulator."""
+    simulator = ScenarioSimulator()
+    simulator.apply_policy({
+        "trend_rates": {"stable": (1.0, 0.9)},
+        "wait_risk_thresholds": [10, 10, 10],
+        "bed_wait_thresholds": [90],
+        "bed_wait_minutes": [5, 0],
+    })
+
+    outcome = simulator.simulate_wait_scenario(40, PATIENT, 30, "stable")
+    assert outcome.predicted_capacity_score == 70
+    assert outcome.probability_of_better_outcome == 0.9
+    assert outcome.risk_level == "MEDIUM", "30 min is over the 10 min threshold"
+    assert outcome.predicted_wait_for_bed == 5
+
+    # Trends left out of trend_rates keep their rates
+    improving = simulator.simulate_wait_scenario(40, PATIENT, 30, "improving")
+    assert improving.predicted_capacity_score == 55
+
+    # Other simulators still use the built-in tables
+    assert ScenarioSimulator().simulate_wait_scenario(40, PATIENT, 30, "stable").predicted_capacity_score == 44.5
+
+
+@pytest.mark.parametrize("policy", [
+    {"surge_mode": True},
+    {"trend_rates": [("stable", (1.0, 0.5))]},
+    {"trend_rates": {"stable": 1.0}},
+    {"trend_rates": {"stable": (1.0,)}},
+    {"trend_rates": {"stable": ("fast", 0.5)}},
+    {"wait_risk_thresholds": (15, 30)},
+    {"wait_risk_thresholds": (15, "30", 60)},
+    {"wait_risk_thresholds": 15},
+    {"bed_wait_thresholds": (70, 50, 30)},
+    {"bed_wait_thresholds": (30, None, 70)},
+    {"bed_wait_minutes": (45, 20, 10)},
+    {"bed_wait_minutes": (45, 20.5, 10, 0)},
+    {"bed_wait_minutes": (45, True, 10, 0)},
+    {"bed_wait_thresholds": (30, 50), "bed_wait_minutes": (45, 20, 10, 0)},
+])
+def test_invalid_policy_is_rejected_without_changes(policy):
+    """Malformed policies raise ValueError and leave every table untouched."""
+    simulator = ScenarioSimulator()
+    before = _outcomes(simulator)
+
+    with pytest.raises(ValueError):
+        simulator.apply_policy({"trend_rates": {"stable": (2.0, 0.9)}, **policy})
+
+    assert _outcomes(simulator) == before
+
+
+def _recommendation() -> FlowRecommendation:
+    simulator = ScenarioSimulator()
+    options = simulator.simulate_placement_scenarios(
+        PATIENT,
+        [
+            {"unit": "ICU", "capacity_score": 65, "current_occupancy": 0.8, "staff_ratio": 2.0},
+            {"unit": "Ward", "capacity_score": 40, "current_occupancy": 0.95, "staff_ratio": 6.0},
+            {"unit": "ED", "capacity_score": 10, "current_occupancy": 0.99, "staff_ratio": 5.0},
+        ],
+        {"risk_score": 55, "trend": "stable"}
+    )
+    return FlowRecommendation(
+        patient_id="P-100",
+        recommended_action=ActionType.ADMIT,
+        recommended_unit="ICU",
+        alternative_options=options,
+        confidence=0.8125,
+        mcda_scores=options[0].mcda_scores,
+        reasoning="Recommend placement in ICU",
+        scenarios_analyzed=simulator.run_timing_analysis(PATIENT, {"capacity_score": 40}),
+        wait_recommendation=15
+    )
+
+
+def test_recommendation_json_bytes_match_to_dict(monkeypatch):
+    """to_json_bytes encodes exactly to_dict(), with or without orjson."""
+    recommendation = _recommendation()
+    expected = json.loads(json.dumps(recommendation.to_dict()))
+
+    encoded = recommendation.to_json_bytes()
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == expected
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert json.loads(recommendation.to_json_bytes()) == expected
+
+
+def test_cached_dicts_are_read_only():
+    """Editing a cached to_dict() result fails and later serializations are unchanged."""
+    recommendation = _recommendation()
+    data = recommendation.to_dict()
+    before = recommendation.to_json_bytes()
+
+    for edit in (
+        lambda: data.__setitem__("urgent", True),
+        lambda: data.update(reasoning=""),
+        lambda: data.pop("patient_id"),
+        lambda: data["mcda_scores"].clear(),
+        lambda: data["alternative_options"][0].__setitem__("unit", "OR"),
+        lambda: data["alternative_options"][0]["constraints"].append("Edited"),
+        lambda: data["scenarios_analyzed"][0]["expected_risks"].append("Edited"),
+    ):
+        with pytest.raises((TypeError, AttributeError)):
+            edit()
+
+    assert recommendation.to_json_bytes() == before
+
+    # A plain copy can be edited freely
+    copy = dict(data)
+    copy["urgent"] = True
+    assert recommendation.to_dict()["urgent"] is False
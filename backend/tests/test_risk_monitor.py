@@ -0,0 +1,107 @@
+"""
+Tests for Risk Monitor Agent
+
+Verifies:
+1. RiskMonitorAgent.assess_patients_batch - same results as assessing one by one
+2. PatientRiskHistory - bounded when built or validated, dumps assessments as a list
+
+Run: python -m pytest backend/tests/test_risk_monitor.py
+"""
+
+import sys
+import os
+import random
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, project_root)
+
+from datetime import datetime, timedelta
+
+from backend.models.patient import Patient, VitalSigns
+from backend.agents.risk_monitor.agent import RiskMonitorAgent
+from backend.agents.risk_monitor.models import MAX_ASSESSMENT_HISTORY, PatientRiskHistory
+
+
+def _census(seed: int, size: int = 12):
+    rng = random.Random(seed)
+    admitted = datetime.now() - timedelta(hours=3)
+    return [
+        Patient(
+            id=f"P{i}",
+            name=f"Patient {i}",
+            age=rng.randint(20, 90),
+            gender="F",
+            current_location="ED",
+            chief_complaint="Shortness of breath",
+            admission_time=admitted - timedelta(minutes=7 * i),
+            comorbidities=rng.sample(["CAD", "CHF", "COPD", "Diabetes", "CKD"], rng.randint(0, 3)),
+            acuity_level=rng.randint(1, 5),
+            vitals=VitalSigns(
+                heart_rate=rng.uniform(40, 160),
+                systolic_bp=rng.uniform(70, 210),
+                diastolic_bp=70,
+                spo2=rng.uniform(82, 100),
+                temperature=rng.uniform(35, 40.5),
+                respiratory_rate=rng.choice([None, rng.uniform(8, 36)])
+            )
+        )
+        for i in range(size)
+    ]
+
+
+def _comparable(assessment):
+    data = assessment.model_dump(mode="json")
+    data.pop("timestamp")
+    data.pop("minutes_since_admission")
+    return data
+
+
+def test_batch_matches_sequential_assessment():
+    """A batch gives the same assessments and agent state as assess_patient in order."""
+    sequential, batched = RiskMonitorAgent(), RiskMonitorAgent()
+
+    # Two rounds, so the second one exercises trends against stored history
+    for seed in (1, 2):
+        expected = [sequential.assess_patient(p) for p in _census(seed)]
+        results = batched.assess_patients_batch(_census(seed))
+
+        assert [_comparable(a) for a in results] == [_comparable(a) for a in expected]
+        assert sorted(batched.get_high_risk_patients()) == sorted(sequential.get_high_risk_patients())
+        assert sorted(batched.get_deteriorating_patients()) == sorted(sequential.get_deteriorating_patients())
+
+    assert batched.assess_patients_batch([]) == []
+
+
+def test_batch_shares_one_clock_read():
+    """Every assessment in a batch measures time since admission from the same instant."""
+    agent = RiskMonitorAgent()
+    patients = _census(3)
+    results = agent.assess_patients_batch(patients)
+
+    admitted = [int((p.admission_time - patients[0].admission_time).total_seconds() / 60) for p in patients]
+    offsets = [a.minutes_since_admission - results[0].minutes_since_admission for a in results]
+    # Admission times are whole minutes apart, so a shared clock keeps the gaps exact
+    assert offsets == [-m for m in admitted]
+
+
+def test_history_is_bounded_and_dumps_a_list():
+    """Long histories keep the newest assessments; dumps keep their list type."""
+    agent = RiskMonitorAgent()
+    assessments = [agent.assess_patient(p) for p in _census(4)]
+    history = PatientRiskHistory(patient_id="P0", assessments=assessments * 10)
+
+    assert len(history.assessments) == MAX_ASSESSMENT_HISTORY
+    assert history.latest_assessment is assessments[-1]
+    assert history.risk_trajectory == [a.risk_score for a in (assessments * 10)[-MAX_ASSESSMENT_HISTORY:]]
+
+    history.add_assessment(assessments[0])
+    assert len(history.assessments) == MAX_ASSESSMENT_HISTORY
+
+    dumped = history.model_dump()
+    assert isinstance(dumped["assessments"], list)
+    assert dumped["assessments"][-1] == assessments[0].model_dump()
+
+    restored = PatientRiskHistory.model_validate_json(history.model_dump_json())
+    assert restored.risk_trajectory == history.risk_trajectory
+    assert restored.latest_vitals == history.latest_vitals
@@ -0,0 +1,55 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+import copy
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - falls back to stdlib json
+
+# Keep stdlib behaviour for datetimes (left to `default`) and non-string dict keys
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize obj to JSON bytes, like json.dumps(obj, default=default).encode()."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=default).encode()
+
+
+def dumps_text(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize obj to a JSON string, like json.dumps(obj, default=default)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(obj, default=default)
+
+
+class ReadOnlyDict(dict):
+    """
+    A dict that rejects modification, for serialized forms cached on models.
+    
+    It is still a dict, so json, orjson, pydantic and FastAPI serialize it
+    as usual. dict(d) or d.copy() gives a mutable copy; copy.copy,
+    copy.deepcopy and pickle keep it read-only.
+    """
+    
+    __slots__ = ()
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only; copy it with dict() to modify")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __deepcopy__(self, memo) -> "ReadOnlyDict":
+        return type(self)(copy.deepcopy(dict(self), memo))
+    
+    def __reduce__(self):
+        return type(self), (dict(self),)